@@ -3,6 +3,7 @@ Database manager for handling database initialization, connections, and migratio
 """
 import os
 import logging
+from contextlib import contextmanager
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.exc import SQLAlchemyError
@@ -94,6 +95,20 @@ class DatabaseManager:
         if session:
             session.close()
     
+    @contextmanager
+    def session_scope(self):
+        """
+        Provide a database session that is closed when the block exits.
+        
+        Yields:
+            Session: SQLAlchemy session object.
+        """
+        session = self.get_session()
+        try:
+            yield session
+        finally:
+            self.close_session(session)
+    
     def check_database_health(self):
         """
         Check if the database is accessible and tables exist.
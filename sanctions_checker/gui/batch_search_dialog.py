@@ -47,21 +47,21 @@ class BatchSearchDialog(QDialog):
         layout = QVBoxLayout(self)
         
         # Create tab widget
-        tab_widget = QTabWidget()
+        self.tab_widget = QTabWidget()
         
         # Tab 1: Select searches
         select_tab = self.create_select_tab()
-        tab_widget.addTab(select_tab, "Select Searches")
+        self.tab_widget.addTab(select_tab, "Select Searches")
         
         # Tab 2: Run batch
         run_tab = self.create_run_tab()
-        tab_widget.addTab(run_tab, "Run Batch")
+        self.tab_widget.addTab(run_tab, "Run Batch")
         
         # Tab 3: Results
         results_tab = self.create_results_tab()
-        tab_widget.addTab(results_tab, "Results")
+        self.tab_widget.addTab(results_tab, "Results")
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
         
         # Bottom buttons
         button_layout = QHBoxLayout()
@@ -331,6 +331,32 @@ class BatchSearchDialog(QDialog):
         self.cancel_button.setEnabled(False)
         self.log_text.append("Batch search cancelled by user.")
     
+    def is_batch_running(self) -> bool:
+        """Check whether a batch search started from this dialog is still running."""
+        return self.batch_service.is_batch_running()
+    
+    def reset_batch(self):
+        """Clear the selection, progress and results of the previous batch search."""
+        self.batch_results = []
+        
+        # Uncheck everything with one selection update instead of one per item
+        self.search_list.blockSignals(True)
+        try:
+            self.select_no_searches()
+        finally:
+            self.search_list.blockSignals(False)
+        self.update_selection()
+        
+        self.log_text.clear()
+        self.preview_table.setRowCount(0)
+        self.progress_bar.reset()
+        self.progress_label.setText("Ready to start batch search")
+        self.results_table.setRowCount(0)
+        self.summary_label.setText("No batch search completed yet")
+        self.export_button.setEnabled(False)
+        
+        self.tab_widget.setCurrentIndex(0)
+    
     @pyqtSlot(int)
     def on_batch_started(self, total_searches: int):
         """Handle batch search started."""
@@ -56,6 +56,8 @@ class DataDownloadWorker(QThread):
 class DataStatusWidget(QWidget):
     """Widget for displaying and managing sanctions data status."""
     
+    data_updated = pyqtSignal()  # emitted when downloads changed the stored data
+    
     def __init__(self, config, data_service: DataStatusService):
         super().__init__()
         self.config = config
@@ -335,6 +337,9 @@ class DataStatusWidget(QWidget):
         successful = sum(1 for success in results.values() if success)
         total = len(results)
         
+        if successful:
+            self.data_updated.emit()
+        
         if successful == total:
             QMessageBox.information(self, "Download Complete", 
                                   f"All {total} data sources downloaded successfully!")
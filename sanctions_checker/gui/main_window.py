@@ -4,6 +4,7 @@ Main window for the Sanctions Checker application.
 
 import re
 import logging
+from functools import lru_cache
 from typing import Optional, List
 from datetime import datetime
 
@@ -11,10 +12,12 @@ from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QTextEdit, QProgressBar,
     QMenuBar, QMenu, QStatusBar, QFrame, QGroupBox, QSplitter,
-    QMessageBox, QTabWidget
+    QMessageBox, QTabWidget, QDialog, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QAction, QFont, QIcon
+from PyQt6.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QUrl, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import QAction, QFont, QIcon, QDesktopServices
 
 from sanctions_checker.config import Config
 from sanctions_checker.services.search_service import SearchService, EntityMatch
@@ -22,10 +25,43 @@ from sanctions_checker.database.manager import DatabaseManager
 from sanctions_checker.utils.resources import resource_manager
 from .results_widget import SearchResultsWidget
 from .logo_upload_dialog import LogoUploadDialog
-from .batch_search_dialog import BatchSearchDialog
 
 logger = logging.getLogger(__name__)
 
+_COFFEE_URL = QUrl("https://buymeacoffee.com/eliesbazine")
+
+# About dialog content
+_ABOUT_DESCRIPTION = (
+    "A comprehensive sanctions screening application that provides "
+    "automated data acquisition, advanced fuzzy matching algorithms, "
+    "and detailed reporting with cryptographic verification.\n\n"
+    "Built with Python and PyQt6."
+)
+
+_COFFEE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #FFDD00;
+        border: 2px solid #FF813F;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+        color: #000000;
+    }
+    QPushButton:hover {
+        background-color: #FF813F;
+        color: #FFFFFF;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size: int) -> QFont:
+    """Get a shared bold font; built on first use since fonts need a running QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
 
 class SearchWorker(QThread):
     """Worker thread for performing searches without blocking the UI."""
@@ -33,9 +69,12 @@ class SearchWorker(QThread):
     # Signals
     search_started = pyqtSignal()
     search_progress = pyqtSignal(int)  # Progress percentage
-    search_completed = pyqtSignal(list, str)  # Search results and record ID
+    search_completed = pyqtSignal(list, str, list)  # Search results, record ID and tags
     search_error = pyqtSignal(str)  # Error message
     
+    # Combo box entity type -> search service entity type (None means no filter)
+    _ENTITY_TYPE_MAP = {"All": None, "Individual": "INDIVIDUAL", "Company": "COMPANY"}
+    
     def __init__(self, search_service: SearchService, search_query: str, entity_type: str, user_id: str = None, tags: list = None):
         super().__init__()
         self.search_service = search_service
@@ -57,9 +96,7 @@ class SearchWorker(QThread):
             self.search_progress.emit(25)
             
             # Convert entity type for search service
-            search_entity_type = None
-            if self.entity_type != "All":
-                search_entity_type = self.entity_type.upper()
+            search_entity_type = self._ENTITY_TYPE_MAP.get(self.entity_type)
             
             self.search_progress.emit(50)
             
@@ -77,7 +114,7 @@ class SearchWorker(QThread):
             self.search_progress.emit(100)
             
             if not self._is_cancelled:
-                self.search_completed.emit(matches, search_record_id)
+                self.search_completed.emit(matches, search_record_id, self.tags)
             
         except Exception as e:
             if not self._is_cancelled:
@@ -88,6 +125,21 @@ class SearchWorker(QThread):
         self._is_cancelled = True
 
 
+class ConfigSaveTask(QRunnable):
+    """Runnable that saves the configuration off the UI thread."""
+    
+    def __init__(self, config: Config):
+        super().__init__()
+        self.config = config
+    
+    def run(self):
+        """Write the configuration to disk."""
+        try:
+            self.config.save()
+        except Exception as e:
+            logger.error("Failed to save configuration: %s", e)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -102,11 +154,24 @@ class MainWindow(QMainWindow):
         self.config = config
         self.search_service = search_service
         self.search_worker: Optional[SearchWorker] = None
+        self.logo_label: Optional[QLabel] = None
+        self.history_widget = None
+        self.custom_sanctions_widget = None
+        self.data_status_widget = None
+        self.statistics_widget = None
         self.current_search_record_id: Optional[str] = None
+        self._last_validated_name: Optional[str] = None
+        self._about_dialog: Optional[QDialog] = None  # Built on first use, kept for the window's lifetime
+        self._custom_service = None
+        self._batch_dialog = None
+        self._close_pending_done = False
         self.validation_timer = QTimer()
         self.validation_timer.setSingleShot(True)
         self.validation_timer.timeout.connect(self._validate_input)
         
+        # Snapshot config values read on hot paths
+        self._refresh_cfg_cache()
+        
         # Initialize database manager
         self.db_manager = DatabaseManager()
         self.db_manager.initialize_database()
@@ -116,7 +181,7 @@ class MainWindow(QMainWindow):
             try:
                 self.search_service = SearchService(self.db_manager)
             except Exception as e:
-                logger.warning(f"Could not initialize search service: {e}")
+                logger.warning("Could not initialize search service: %s", e)
                 self.search_service = None
         
         # Initialize data service for history widget
@@ -126,21 +191,33 @@ class MainWindow(QMainWindow):
                 from ..services.data_service import DataService
                 self.data_service = DataService(self.search_service.db_manager)
             except Exception as e:
-                logger.warning(f"Could not initialize data service: {e}")
+                logger.warning("Could not initialize data service: %s", e)
                 self.data_service = None
         
         self.setup_ui()
         self.setup_menu()
         self.setup_status_bar()
         self.setup_connections()
+        
+        # Let pending background work (e.g. the config save on close) finish before exit
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(QThreadPool.globalInstance().waitForDone)
+    
+    def _refresh_cfg_cache(self):
+        """Snapshot frequently read config values into attributes."""
+        self._cfg_user_id = self.config.get('branding.user_id', 'gui_user')
+        self._cfg_window_w = self.config.get('gui.window_width', 1200)
+        self._cfg_window_h = self.config.get('gui.window_height', 800)
+        self._cfg_tags = tuple(self.config.get('search.tags', []))
     
     def setup_ui(self):
         """Set up the user interface."""
         self.setWindowTitle("Sanctions Checker")
         self.setGeometry(
             100, 100,
-            self.config.get('gui.window_width', 1200),
-            self.config.get('gui.window_height', 800)
+            self._cfg_window_w,
+            self._cfg_window_h
         )
         
         # Set application icon
@@ -185,9 +262,8 @@ class MainWindow(QMainWindow):
         self.tags_combo.clear()
         self.tags_combo.addItem("")  # Empty option
         
-        # Get tags from config
-        tags = self.config.get('search.tags', [])
-        for tag in tags:
+        # Get tags from cached config snapshot
+        for tag in self._cfg_tags:
             self.tags_combo.addItem(tag)
     
     def _create_search_panel(self) -> QWidget:
@@ -201,20 +277,17 @@ class MainWindow(QMainWindow):
         
         # Logo section
         logo_layout = QHBoxLayout()
-        logo_label = QLabel()
         logo_pixmap = resource_manager.get_logo_pixmap(width=300)  # Scale to fit panel
         if not logo_pixmap.isNull():
-            logo_label.setPixmap(logo_pixmap)
-            logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            logo_layout.addWidget(logo_label)
+            self.logo_label = QLabel()
+            self.logo_label.setPixmap(logo_pixmap)
+            self.logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            logo_layout.addWidget(self.logo_label)
             layout.addLayout(logo_layout)
         
         # Title
         title = QLabel("Sanctions Search")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_bold_font(14))
         layout.addWidget(title)
         
         # Search input group
@@ -230,7 +303,8 @@ class MainWindow(QMainWindow):
         # Entity type selection
         search_layout.addWidget(QLabel("Entity Type:"), 1, 0)
         self.entity_type_combo = QComboBox()
-        self.entity_type_combo.addItems(["All", "Individual", "Company"])
+        self.entity_type_combo.addItems(list(SearchWorker._ENTITY_TYPE_MAP))
+        self._entity_type_index = {text: i for i, text in enumerate(SearchWorker._ENTITY_TYPE_MAP)}
         search_layout.addWidget(self.entity_type_combo, 1, 1)
         
         # Tag selection
@@ -278,15 +352,17 @@ class MainWindow(QMainWindow):
     def _create_tabs_panel(self) -> QWidget:
         """Create the tabbed panel for results, history, and settings."""
         tabs = QTabWidget()
+        self._tabs = tabs
+        self._tab_index = {}
         
         # Results tab - use the new SearchResultsWidget
         self.results_widget = SearchResultsWidget()
-        tabs.addTab(self.results_widget, "Results")
+        self._tab_index["Results"] = tabs.addTab(self.results_widget, "Results")
         
         # History tab - use the new SearchHistoryWidget
         from .history_widget import SearchHistoryWidget
         self.history_widget = SearchHistoryWidget(self.data_service)
-        tabs.addTab(self.history_widget, "History")
+        self._tab_index["History"] = tabs.addTab(self.history_widget, "History")
         
         # Data Status tab
         from .data_status_widget import DataStatusWidget
@@ -295,60 +371,62 @@ class MainWindow(QMainWindow):
             if self.search_service and self.search_service.db_manager:
                 data_status_service = DataStatusService(self.config, self.search_service.db_manager)
                 self.data_status_widget = DataStatusWidget(self.config, data_status_service)
-                tabs.addTab(self.data_status_widget, "📊 Data Status")
+                self._tab_index["Data Status"] = tabs.addTab(self.data_status_widget, "📊 Data Status")
             else:
                 # Create placeholder if no database connection
                 placeholder = QLabel("Database connection required for data status monitoring")
                 placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                tabs.addTab(placeholder, "📊 Data Status")
+                self._tab_index["Data Status"] = tabs.addTab(placeholder, "📊 Data Status")
         except Exception as e:
-            logger.warning(f"Could not create data status widget: {e}")
-            placeholder = QLabel(f"Error loading data status: {str(e)}")
+            logger.warning("Could not create data status widget: %s", e)
+            placeholder = QLabel(f"Error loading data status: {e}")
             placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tabs.addTab(placeholder, "📊 Data Status")
+            self._tab_index["Data Status"] = tabs.addTab(placeholder, "📊 Data Status")
         
         # Statistics tab
         from .statistics_widget import StatisticsWidget
         try:
             if self.search_service and self.search_service.db_manager:
                 self.statistics_widget = StatisticsWidget(self.config, data_status_service)
-                tabs.addTab(self.statistics_widget, "📈 Statistics")
+                self._tab_index["Statistics"] = tabs.addTab(self.statistics_widget, "📈 Statistics")
+                # Recalculate statistics when downloads change the data
+                if self.data_status_widget is not None:
+                    self.data_status_widget.data_updated.connect(self.statistics_widget.refresh_statistics)
             else:
                 # Create placeholder if no database connection
                 placeholder = QLabel("Database connection required for statistics")
                 placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                tabs.addTab(placeholder, "📈 Statistics")
+                self._tab_index["Statistics"] = tabs.addTab(placeholder, "📈 Statistics")
         except Exception as e:
-            logger.warning(f"Could not create statistics widget: {e}")
-            placeholder = QLabel(f"Error loading statistics: {str(e)}")
+            logger.warning("Could not create statistics widget: %s", e)
+            placeholder = QLabel(f"Error loading statistics: {e}")
             placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tabs.addTab(placeholder, "📈 Statistics")
+            self._tab_index["Statistics"] = tabs.addTab(placeholder, "📈 Statistics")
         
         # Custom Sanctions tab
         from .custom_sanctions_management_widget import CustomSanctionsManagementWidget
-        from ..services.custom_sanctions_service import CustomSanctionsService
         try:
             if self.search_service and self.search_service.db_manager:
-                custom_sanctions_service = CustomSanctionsService(self.search_service.db_manager)
-                self.custom_sanctions_widget = CustomSanctionsManagementWidget(custom_sanctions_service)
-                tabs.addTab(self.custom_sanctions_widget, "📝 Custom Sanctions")
+                self.custom_sanctions_widget = CustomSanctionsManagementWidget(self._get_custom_service())
+                self._tab_index["Custom Sanctions"] = tabs.addTab(self.custom_sanctions_widget, "📝 Custom Sanctions")
             else:
                 # Create placeholder if no database connection
                 placeholder = QLabel("Database connection required for custom sanctions management")
                 placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                tabs.addTab(placeholder, "📝 Custom Sanctions")
+                self._tab_index["Custom Sanctions"] = tabs.addTab(placeholder, "📝 Custom Sanctions")
         except Exception as e:
-            logger.warning(f"Could not create custom sanctions widget: {e}")
-            placeholder = QLabel(f"Error loading custom sanctions: {str(e)}")
+            logger.warning("Could not create custom sanctions widget: %s", e)
+            placeholder = QLabel(f"Error loading custom sanctions: {e}")
             placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            tabs.addTab(placeholder, "📝 Custom Sanctions")
+            self._tab_index["Custom Sanctions"] = tabs.addTab(placeholder, "📝 Custom Sanctions")
         
         # Settings tab - use the new SettingsWidget
         from .settings_widget import SettingsWidget
         self.settings_widget = SettingsWidget(self.config)
-        # Connect settings changes to refresh tags combo
+        # Connect settings changes to refresh config snapshot and tags combo
+        self.settings_widget.settings_saved.connect(self._refresh_cfg_cache)
         self.settings_widget.settings_saved.connect(self.refresh_tags_combo)
-        tabs.addTab(self.settings_widget, "⚙️ Settings")
+        self._tab_index["Settings"] = tabs.addTab(self.settings_widget, "⚙️ Settings")
         
         return tabs
     
@@ -484,7 +562,7 @@ class MainWindow(QMainWindow):
         self.results_widget.export_requested.connect(self._export_results_list)
         
         # Connect history widget signals
-        if hasattr(self, 'history_widget'):
+        if self.history_widget is not None:
             self.history_widget.search_replay_requested.connect(self._replay_search)
             self.history_widget.search_comparison_requested.connect(self._compare_searches)
     
@@ -498,34 +576,44 @@ class MainWindow(QMainWindow):
         """Validate search input and update UI accordingly."""
         name = self.name_input.text().strip()
         
-        # Clear previous validation message
-        self.validation_label.clear()
+        # Nothing to do if this exact text was already validated
+        if name == self._last_validated_name:
+            return
+        self._last_validated_name = name
         
         if not name:
-            self.search_button.setEnabled(False)
+            self._set_validation_state("", False)
             return
         
         # Validate name length
         if len(name) < 2:
-            self.validation_label.setText("Name must be at least 2 characters long")
-            self.search_button.setEnabled(False)
+            self._set_validation_state("Name must be at least 2 characters long", False)
             return
         
         # Validate name contains letters
         if not re.search(r'[a-zA-Z]', name):
-            self.validation_label.setText("Name must contain at least one letter")
-            self.search_button.setEnabled(False)
+            self._set_validation_state("Name must contain at least one letter", False)
             return
         
         # Check for potentially problematic characters
         if re.search(r'[<>"\']', name):
-            self.validation_label.setText("Name contains invalid characters")
-            self.search_button.setEnabled(False)
+            self._set_validation_state("Name contains invalid characters", False)
             return
         
         # Input is valid
-        self.search_button.setEnabled(True)
-        self.validation_label.setText("")
+        self._set_validation_state("", True)
+    
+    def _set_validation_state(self, message: str, valid: bool):
+        """Update the validation label and search button, skipping no-op updates."""
+        if self.validation_label.text() != message:
+            self.validation_label.setText(message)
+        if self.search_button.isEnabled() != valid:
+            self.search_button.setEnabled(valid)
+    
+    @staticmethod
+    def _parse_tags(text: str) -> List[str]:
+        """Split comma-separated tag text into a list of non-empty, stripped tags."""
+        return list(filter(None, map(str.strip, text.split(',')))) if text else []
     
     def _perform_search(self):
         """Perform sanctions search."""
@@ -544,14 +632,10 @@ class MainWindow(QMainWindow):
         entity_type = self.entity_type_combo.currentText()
         
         # Get tags from combo box
-        tags = []
-        tag_text = self.tags_combo.currentText().strip()
-        if tag_text:
-            # Split by comma and clean up
-            tags = [tag.strip() for tag in tag_text.split(',') if tag.strip()]
+        tags = self._parse_tags(self.tags_combo.currentText())
         
-        # Get user ID from settings
-        user_id = self.config.get('branding.user_id', 'gui_user')
+        # Get user ID from cached settings
+        user_id = self._cfg_user_id
         
         # Disable search button and show progress
         self.search_button.setEnabled(False)
@@ -588,8 +672,8 @@ class MainWindow(QMainWindow):
         """Handle search progress updates."""
         self.progress_bar.setValue(progress)
     
-    @pyqtSlot(list, str)
-    def _on_search_completed(self, results, search_record_id):
+    @pyqtSlot(list, str, list)
+    def _on_search_completed(self, results, search_record_id, search_tags):
         """Handle search completion."""
         # Reset UI
         self.search_button.setEnabled(True)
@@ -600,13 +684,7 @@ class MainWindow(QMainWindow):
         # Store search record ID for potential export
         self.current_search_record_id = search_record_id
         
-        # Get tags that were used for this search
-        tag_text = self.tags_combo.currentText().strip()
-        search_tags = []
-        if tag_text:
-            search_tags = [tag.strip() for tag in tag_text.split(',') if tag.strip()]
-        
-        # Display results in the results widget
+        # Display results in the results widget, tagged with the tags the search ran with
         self.results_widget.set_results(results, search_tags)
         
         # Update status
@@ -616,7 +694,7 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Search completed - no matches found")
         
         # Refresh history widget to show the new search
-        if hasattr(self, 'history_widget'):
+        if self.history_widget is not None:
             # Use a timer to refresh after a short delay to ensure the record is saved
             QTimer.singleShot(1000, self.history_widget.refresh_history)
     
@@ -691,7 +769,7 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(
                 self, 
                 "Export Error", 
-                f"An error occurred while opening export dialog:\n{str(e)}"
+                f"An error occurred while opening export dialog:\n{e}"
             )
     
     def _update_data(self):
@@ -716,19 +794,12 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(
                 self, 
                 "Verification Error", 
-                f"An error occurred while opening verification dialog:\n{str(e)}"
+                f"An error occurred while opening verification dialog:\n{e}"
             )
     
     def _show_settings(self):
         """Show settings tab."""
-        # Find the tabs widget and switch to settings tab
-        tabs_widget = self.findChild(QTabWidget)
-        if tabs_widget:
-            # Find the settings tab index
-            for i in range(tabs_widget.count()):
-                if tabs_widget.tabText(i) == "Settings":
-                    tabs_widget.setCurrentIndex(i)
-                    break
+        self._tabs.setCurrentIndex(self._tab_index["Settings"])
     
     def _upload_logo(self):
         """Show logo upload dialog."""
@@ -738,6 +809,9 @@ class MainWindow(QMainWindow):
     
     def _on_logo_updated(self):
         """Handle logo update event."""
+        # Drop cached images so the new logo is loaded from disk
+        resource_manager.clear_cache()
+        
         # Refresh the logo display in the main window
         self._update_logo_display()
         self.status_bar.showMessage("Logo updated successfully", 3000)
@@ -750,20 +824,24 @@ class MainWindow(QMainWindow):
             self.setWindowIcon(icon)
             
             # Update logo in search panel if it exists
-            if hasattr(self, 'logo_label'):
-                logo_pixmap = resource_manager.get_logo_pixmap(150, 60)
+            if self.logo_label is not None:
+                logo_pixmap = resource_manager.get_logo_pixmap(width=300)
                 if logo_pixmap and not logo_pixmap.isNull():
                     self.logo_label.setPixmap(logo_pixmap)
         except Exception as e:
-            logger.error(f"Error updating logo display: {e}")
+            logger.error("Error updating logo display: %s", e)
     
     def _show_about(self):
         """Show about dialog."""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-        from PyQt6.QtCore import QUrl
-        from PyQt6.QtGui import QDesktopServices, QPixmap
-        
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.exec()
+    
+    def _build_about_dialog(self):
+        """Build the about dialog."""
         dialog = QDialog(self)
+        # The dialog is cached and re-shown, so it must survive being closed
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, False)
         dialog.setWindowTitle("About Sanctions Checker")
         dialog.setFixedSize(400, 300)
         
@@ -771,20 +849,12 @@ class MainWindow(QMainWindow):
         
         # Title
         title_label = QLabel("Sanctions Checker v1.0")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_bold_font(16))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
         
         # Description
-        desc_label = QLabel(
-            "A comprehensive sanctions screening application that provides "
-            "automated data acquisition, advanced fuzzy matching algorithms, "
-            "and detailed reporting with cryptographic verification.\n\n"
-            "Built with Python and PyQt6."
-        )
+        desc_label = QLabel(_ABOUT_DESCRIPTION)
         desc_label.setWordWrap(True)
         desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(desc_label)
@@ -796,10 +866,7 @@ class MainWindow(QMainWindow):
         
         coffee_label = QLabel("☕ Support the Developer")
         coffee_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        coffee_font = QFont()
-        coffee_font.setPointSize(12)
-        coffee_font.setBold(True)
-        coffee_label.setFont(coffee_font)
+        coffee_label.setFont(_bold_font(12))
         coffee_layout.addWidget(coffee_label)
         
         support_label = QLabel("If you find this application useful, consider buying me a coffee!")
@@ -809,20 +876,7 @@ class MainWindow(QMainWindow):
         
         coffee_button = QPushButton("☕ Buy Me a Coffee")
         coffee_button.clicked.connect(self._open_coffee_link)
-        coffee_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FFDD00;
-                border: 2px solid #FF813F;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                color: #000000;
-            }
-            QPushButton:hover {
-                background-color: #FF813F;
-                color: #FFFFFF;
-            }
-        """)
+        coffee_button.setStyleSheet(_COFFEE_BUTTON_QSS)
         coffee_layout.addWidget(coffee_button)
         
         layout.addWidget(coffee_frame)
@@ -832,17 +886,18 @@ class MainWindow(QMainWindow):
         close_button.clicked.connect(dialog.accept)
         layout.addWidget(close_button)
         
-        dialog.exec()
+        return dialog
+    
+    def _get_custom_service(self):
+        """Get the shared custom sanctions service, creating it on first use."""
+        if self._custom_service is None:
+            from ..services.custom_sanctions_service import CustomSanctionsService
+            self._custom_service = CustomSanctionsService(self.search_service.db_manager)
+        return self._custom_service
     
     def _show_custom_sanctions(self):
         """Show the custom sanctions management tab."""
-        tabs_widget = self.findChild(QTabWidget)
-        if tabs_widget:
-            # Find the custom sanctions tab index
-            for i in range(tabs_widget.count()):
-                if "Custom Sanctions" in tabs_widget.tabText(i):
-                    tabs_widget.setCurrentIndex(i)
-                    break
+        self._tabs.setCurrentIndex(self._tab_index["Custom Sanctions"])
     
     def _import_custom_sanctions(self):
         """Show custom sanctions import dialog."""
@@ -855,25 +910,23 @@ class MainWindow(QMainWindow):
                 )
                 return
             
-            from ..services.custom_sanctions_service import CustomSanctionsService
             from .custom_sanctions_import_dialog import CustomSanctionsImportDialog
             
-            custom_service = CustomSanctionsService(self.search_service.db_manager)
-            dialog = CustomSanctionsImportDialog(custom_service, self)
+            dialog = CustomSanctionsImportDialog(self._get_custom_service(), self)
             
             if dialog.exec():
                 # Refresh custom sanctions widget if it exists
-                if hasattr(self, 'custom_sanctions_widget'):
+                if self.custom_sanctions_widget is not None:
                     self.custom_sanctions_widget.refresh_entity_list()
                 
                 self.status_bar.showMessage("Custom sanctions imported successfully", 3000)
             
         except Exception as e:
-            logger.error(f"Error opening custom sanctions import dialog: {e}")
+            logger.error("Error opening custom sanctions import dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Import Error",
-                f"Failed to open custom sanctions import dialog:\n{str(e)}"
+                f"Failed to open custom sanctions import dialog:\n{e}"
             )
     
     def _export_custom_sanctions(self):
@@ -887,52 +940,49 @@ class MainWindow(QMainWindow):
                 )
                 return
             
-            from ..services.custom_sanctions_service import CustomSanctionsService
             from .custom_sanctions_export_dialog import CustomSanctionsExportDialog
             
-            custom_service = CustomSanctionsService(self.search_service.db_manager)
-            dialog = CustomSanctionsExportDialog(custom_service, self)
+            dialog = CustomSanctionsExportDialog(self._get_custom_service(), self)
             
             if dialog.exec():
                 self.status_bar.showMessage("Custom sanctions exported successfully", 3000)
             
         except Exception as e:
-            logger.error(f"Error opening custom sanctions export dialog: {e}")
+            logger.error("Error opening custom sanctions export dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Export Error",
-                f"Failed to open custom sanctions export dialog:\n{str(e)}"
+                f"Failed to open custom sanctions export dialog:\n{e}"
             )
     
     def _open_coffee_link(self):
         """Open the Buy Me a Coffee link in the default browser."""
-        from PyQt6.QtCore import QUrl
-        from PyQt6.QtGui import QDesktopServices
-        
-        url = QUrl("https://buymeacoffee.com/eliesbazine")
-        QDesktopServices.openUrl(url)
+        QDesktopServices.openUrl(_COFFEE_URL)
     
     def _replay_search(self, query: str, entity_type: str, search_record_id: str):
         """Replay a search from history."""
-        # Set the search parameters
-        self.name_input.setText(query)
-        
-        # Set entity type
-        if entity_type in ["All", "Individual", "Company"]:
-            index = self.entity_type_combo.findText(entity_type)
-            if index >= 0:
+        # Apply all UI changes with a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Set the search parameters
+            self.name_input.setText(query)
+            
+            # Set entity type
+            index = self._entity_type_index.get(entity_type)
+            if index is not None:
                 self.entity_type_combo.setCurrentIndex(index)
+            
+            # Switch to results tab
+            self._tabs.setCurrentIndex(self._tab_index["Results"])
+        finally:
+            self.setUpdatesEnabled(True)
         
-        # Switch to results tab
-        tabs_widget = self.findChild(QTabWidget)
-        if tabs_widget:
-            for i in range(tabs_widget.count()):
-                if tabs_widget.tabText(i) == "Results":
-                    tabs_widget.setCurrentIndex(i)
-                    break
+        # Validate now rather than waiting for the debounce so the search can start
+        self.validation_timer.stop()
+        self._validate_input()
         
-        # Perform the search
-        self._perform_search()
+        # Start the search once the info message is up rather than before it
+        QTimer.singleShot(0, self._perform_search)
         
         # Show info message
         QMessageBox.information(
@@ -945,33 +995,43 @@ class MainWindow(QMainWindow):
         """Launch batch search dialog with selected searches pre-filtered."""
         try:
             # Open batch search dialog
-            dialog = BatchSearchDialog(self.search_service, self.db_manager, self)
+            dialog = self._get_batch_dialog()
             
             # If specific searches were selected, we could pre-filter them
             # For now, just open the dialog and let user select
             dialog.exec()
             
         except Exception as e:
-            logger.error(f"Error opening batch search dialog: {e}")
-            from PyQt6.QtWidgets import QMessageBox
+            logger.error("Error opening batch search dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Batch Search Error",
-                f"Failed to open batch search dialog:\n{str(e)}\n\nPlease check that all required components are installed."
+                f"Failed to open batch search dialog:\n{e}\n\nPlease check that all required components are installed."
             )
     
+    def _get_batch_dialog(self):
+        """Get the batch search dialog, building it on first use."""
+        if self._batch_dialog is None:
+            from .batch_search_dialog import BatchSearchDialog
+            self._batch_dialog = BatchSearchDialog(self.search_service, self.db_manager, self)
+        elif not self._batch_dialog.is_batch_running():
+            # Start from a clean dialog and pick up searches run since it was last shown;
+            # a batch still running keeps its state so its results can land
+            self._batch_dialog.reset_batch()
+            self._batch_dialog.filter_searches()
+        return self._batch_dialog
+    
     def _batch_search(self):
         """Show batch search dialog."""
         try:
-            dialog = BatchSearchDialog(self.search_service, self.db_manager, self)
+            dialog = self._get_batch_dialog()
             dialog.exec()
         except Exception as e:
-            logger.error(f"Error opening batch search dialog: {e}")
-            from PyQt6.QtWidgets import QMessageBox
+            logger.error("Error opening batch search dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Batch Search Error",
-                f"Failed to open batch search dialog:\n{str(e)}"
+                f"Failed to open batch search dialog:\n{e}"
             )
     
     def _batch_export(self):
@@ -979,6 +1039,7 @@ class MainWindow(QMainWindow):
         try:
             from .export_dialog import ExportDialog
             from ..models.search_record import SearchRecord
+            from sqlalchemy.orm import selectinload
             
             if not self.search_service or not self.search_service.db_manager:
                 QMessageBox.warning(
@@ -989,9 +1050,11 @@ class MainWindow(QMainWindow):
                 return
             
             # Get recent search records
-            session = self.search_service.db_manager.get_session()
-            try:
-                search_records = session.query(SearchRecord).order_by(
+            with self.search_service.db_manager.session_scope() as session:
+                # Load the results collections in one extra query rather than one per record
+                search_records = session.query(SearchRecord).options(
+                    selectinload(SearchRecord.results)
+                ).order_by(
                     SearchRecord.search_timestamp.desc()
                 ).limit(50).all()
                 
@@ -1010,9 +1073,6 @@ class MainWindow(QMainWindow):
                 )
                 
                 export_dialog.exec()
-                
-            finally:
-                session.close()
             
         except ImportError as e:
             QMessageBox.warning(
@@ -1024,18 +1084,32 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(
                 self, 
                 "Batch Export Error", 
-                f"An error occurred while opening batch export dialog:\n{str(e)}"
+                f"An error occurred while opening batch export dialog:\n{e}"
             )
     
 
     
+    def _finish_close(self):
+        """Complete a close that was deferred while a search worker was stopping."""
+        if not self._close_pending_done:
+            self._close_pending_done = True
+            self.close()
+            # The window was already hidden, so Qt won't see a last-window close; quit explicitly
+            QApplication.instance().quit()
+    
     def closeEvent(self, event):
         """Handle application close event."""
-        # Cancel any running search
+        # Cancel any running search without blocking the UI thread for long
         if self.search_worker and self.search_worker.isRunning():
             self.search_worker.cancel()
-            self.search_worker.wait(3000)  # Wait up to 3 seconds
+            if not self.search_worker.wait(200) and not self._close_pending_done:
+                # Hide now and finish closing once the worker stops, with a hard backstop
+                self.hide()
+                self.search_worker.finished.connect(self._finish_close)
+                QTimer.singleShot(3000, self._finish_close)
+                event.ignore()
+                return
         
-        # Save configuration
-        self.config.save()
+        # Save configuration in the background so the window closes immediately
+        QThreadPool.globalInstance().start(ConfigSaveTask(self.config))
         event.accept()
\ No newline at end of file
@@ -2,28 +2,65 @@
 Search results display widget with table, filtering, sorting, and detail view.
 """
 
+import bisect
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QHeaderView, QLabel, QLineEdit, QComboBox, QPushButton, QSplitter,
     QTextEdit, QGroupBox, QFrame, QProgressBar, QMessageBox, QMenu,
-    QAbstractItemView, QCheckBox, QSpinBox
+    QAbstractItemView, QCheckBox, QSpinBox, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSortFilterProxyModel, QAbstractTableModel, QModelIndex
-from PyQt6.QtGui import QAction, QFont, QColor, QPalette
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker, QSortFilterProxyModel, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QAction, QFont, QColor, QPalette, QBrush
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 from ..services.search_service import EntityMatch
 from ..models import SanctionedEntity
 
 logger = logging.getLogger(__name__)
 
+# Row backgrounds are transparent for readability; shared instead of allocated per row
+_TRANSPARENT = QColor(0, 0, 0, 0)
+_TRANSPARENT_BRUSH = QBrush(_TRANSPARENT)
+
+# Confidence bucket lower bounds and the indicator shown for each bucket (very low, low, medium, high)
+_CONFIDENCE_THRESHOLDS = (0.4, 0.6, 0.8)
+_CONFIDENCE_INDICATORS = ("⚪", "🟡", "🟠", "🔴")
+
+# HTML for the match detail view; the *_block fields are empty when the match has no such data
+_DETAIL_TEMPLATE = (
+    "<h3>{name}</h3><br>"
+    "<b>Type:</b> {entity_type}<br>"
+    "<b>Source:</b> {source} (v{source_version})<br>"
+    "<b>Sanctions Type:</b> {sanctions_type}<br>"
+    "{effective_date_block}"
+    "{aliases_block}"
+    "<br>"
+    "<h4>Match Analysis</h4><br>"
+    "<b>Overall Confidence:</b> {overall_confidence:.1%}<br>"
+    "<b>Matched Name:</b> {matched_name}"
+    "{scores_block}"
+    "{normalization_block}"
+    "{additional_info_block}"
+)
+
 
 class SearchResultsTableModel(QAbstractTableModel):
     """Table model for search results."""
     
+    # Custom role returning every role the delegate paints with in a single data() call
+    MultipleRoles = Qt.ItemDataRole.UserRole.value + 1
+    # Custom role returning raw values to sort by (floats and datetimes rather than formatted text)
+    SortRole = Qt.ItemDataRole.UserRole.value + 2
+    
     # Column definitions
     COLUMNS = [
         ('Name', 'name'),
@@ -34,11 +71,18 @@ class SearchResultsTableModel(QAbstractTableModel):
         ('Effective Date', 'effective_date'),
         ('Best Algorithm', 'best_algorithm')
     ]
+    COLUMN_INDEX = {key: column for column, (_, key) in enumerate(COLUMNS)}
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.matches: List[EntityMatch] = []
         self.headers = [col[0] for col in self.COLUMNS]
+        # Formatted display strings per row, filled on first paint
+        self._display: List[Optional[tuple]] = []
+        # Per-row tuples of {role: value} dicts served through MultipleRoles
+        self._roles: List[Optional[tuple]] = []
+        # Algorithm scores sorted best-first, keyed by id() of the match
+        self._ranked_scores: Dict[int, list] = {}
     
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self.matches)
@@ -58,19 +102,65 @@ class SearchResultsTableModel(QAbstractTableModel):
         match = self.matches[index.row()]
         column_key = self.COLUMNS[index.column()][1]
         
-        if role == Qt.ItemDataRole.DisplayRole:
-            return self._get_display_value(match, column_key)
+        if role == self.MultipleRoles:
+            return self._get_row_roles(index.row())[index.column()]
+        elif role == Qt.ItemDataRole.DisplayRole:
+            return self._get_display_row(index.row())[index.column()]
+        elif role == self.SortRole:
+            return self._get_sort_value(index.row(), column_key)
         elif role == Qt.ItemDataRole.BackgroundRole:
             return self._get_background_color(match)
         elif role == Qt.ItemDataRole.TextAlignmentRole:
-            if column_key in ['overall_confidence']:
-                return Qt.AlignmentFlag.AlignCenter
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return self._get_alignment(column_key)
         elif role == Qt.ItemDataRole.UserRole:
             return match  # Store the full match object
         
         return None
     
+    def _get_display_row(self, row: int) -> tuple:
+        """Get the formatted display values for a row, formatting them on first use."""
+        display = self._display[row]
+        if display is None:
+            match = self.matches[row]
+            display = tuple(self._get_display_value(match, key) for _, key in self.COLUMNS)
+            self._display[row] = display
+        return display
+    
+    def _get_row_roles(self, row: int) -> tuple:
+        """Get the painted roles of every cell in a row, building them on first use."""
+        roles = self._roles[row]
+        if roles is None:
+            display = self._get_display_row(row)
+            background = self._get_background_brush(self.matches[row])
+            roles = tuple(
+                {
+                    Qt.ItemDataRole.DisplayRole: display[column],
+                    Qt.ItemDataRole.TextAlignmentRole: self._get_alignment(key),
+                    Qt.ItemDataRole.BackgroundRole: background,
+                }
+                for column, (_, key) in enumerate(self.COLUMNS)
+            )
+            self._roles[row] = roles
+        return roles
+    
+    def _get_sort_value(self, row: int, column_key: str):
+        """Get the raw value a column sorts by."""
+        match = self.matches[row]
+        if column_key == 'overall_confidence':
+            return match.overall_confidence
+        elif column_key == 'effective_date':
+            return match.entity.effective_date or datetime.min
+        elif column_key == 'best_algorithm':
+            ranked = self.get_ranked_scores(match)
+            return ranked[0][1] if ranked else -1.0
+        return self._get_display_row(row)[self.COLUMN_INDEX[column_key]]
+    
+    def _get_alignment(self, column_key: str) -> Qt.AlignmentFlag:
+        """Get the text alignment for a column."""
+        if column_key in ['overall_confidence']:
+            return Qt.AlignmentFlag.AlignCenter
+        return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+    
     def _get_display_value(self, match: EntityMatch, column_key: str) -> str:
         """Get the display value for a specific column."""
         if column_key == 'name':
@@ -78,7 +168,7 @@ class SearchResultsTableModel(QAbstractTableModel):
         elif column_key == 'entity_type':
             return match.entity.entity_type.title()
         elif column_key == 'overall_confidence':
-            return f"{match.overall_confidence:.1%}"
+            return f"{self._get_confidence_indicator(match.overall_confidence)} {match.overall_confidence:.1%}"
         elif column_key == 'source':
             return match.entity.source
         elif column_key == 'sanctions_type':
@@ -88,23 +178,43 @@ class SearchResultsTableModel(QAbstractTableModel):
                 return match.entity.effective_date.strftime('%Y-%m-%d')
             return 'N/A'
         elif column_key == 'best_algorithm':
-            if match.confidence_scores:
-                best_alg, best_score = max(match.confidence_scores.items(), key=lambda x: x[1])
+            ranked = self.get_ranked_scores(match)
+            if ranked:
+                best_alg, best_score = ranked[0]
                 return f"{best_alg.title()} ({best_score:.1%})"
             return 'N/A'
         return ''
     
+    def _get_confidence_indicator(self, confidence: float) -> str:
+        """Get the emoji indicator for a confidence level."""
+        return _CONFIDENCE_INDICATORS[bisect.bisect_right(_CONFIDENCE_THRESHOLDS, confidence)]
+    
     def _get_background_color(self, match: EntityMatch) -> QColor:
         """Get background color based on confidence level - using transparent for better readability."""
         # Return transparent color to avoid white backgrounds that make text hard to read
-        return QColor(0, 0, 0, 0)  # Transparent
+        return _TRANSPARENT
+    
+    def _get_background_brush(self, match: EntityMatch) -> QBrush:
+        """Get the background brush for a row, matching _get_background_color."""
+        return _TRANSPARENT_BRUSH
     
     def set_matches(self, matches: List[EntityMatch]):
         """Update the matches data."""
         self.beginResetModel()
         self.matches = matches
+        self._display = [None] * len(matches)
+        self._roles = [None] * len(matches)
+        self._ranked_scores = {}
         self.endResetModel()
     
+    def get_ranked_scores(self, match: EntityMatch) -> list:
+        """Get a match's (algorithm, score) pairs sorted best first, computed once per result set."""
+        ranked = self._ranked_scores.get(id(match))
+        if ranked is None:
+            ranked = sorted((match.confidence_scores or {}).items(), key=lambda x: x[1], reverse=True)
+            self._ranked_scores[id(match)] = ranked
+        return ranked
+    
     def get_match(self, row: int) -> Optional[EntityMatch]:
         """Get the match at the specified row."""
         if 0 <= row < len(self.matches):
@@ -112,6 +222,63 @@ class SearchResultsTableModel(QAbstractTableModel):
         return None
 
 
+class SearchResultsDelegate(QStyledItemDelegate):
+    """Item delegate that reads all painted roles of a cell with one MultipleRoles request."""
+    
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        roles = index.data(SearchResultsTableModel.MultipleRoles)
+        if roles is None:
+            super().initStyleOption(option, index)
+            return
+        
+        option.index = index
+        option.text = roles[Qt.ItemDataRole.DisplayRole]
+        option.features |= QStyleOptionViewItem.ViewItemFeature.HasDisplay
+        option.displayAlignment = roles[Qt.ItemDataRole.TextAlignmentRole]
+        option.backgroundBrush = roles[Qt.ItemDataRole.BackgroundRole]
+
+
+class SearchResultsFilterProxyModel(QSortFilterProxyModel):
+    """Sorting proxy that only shows the source rows accepted by the widget's filters, up to a row limit."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._filtered_rows = None  # Source rows passing the filters, in order; None shows every row
+        self._row_limit = None
+        self._accepted_rows = None
+    
+    def set_accepted_rows(self, rows, row_limit: Optional[int] = None, invalidate: bool = True):
+        """
+        Set the source rows passing the filters (None shows all rows) and how many of them to show.
+        
+        Pass invalidate=False when the source model is about to be reset, which refilters anyway.
+        """
+        self._filtered_rows = None if rows is None else list(rows)
+        self._row_limit = row_limit
+        self._update_accepted_rows(invalidate)
+    
+    def set_row_limit(self, row_limit: Optional[int]):
+        """Change how many of the filtered rows are shown without filtering again."""
+        if row_limit != self._row_limit:
+            self._row_limit = row_limit
+            self._update_accepted_rows()
+    
+    def shown_rows(self) -> Optional[List[int]]:
+        """Get the source rows currently shown, in filter order (None when unfiltered)."""
+        if self._filtered_rows is None:
+            return None
+        return self._filtered_rows[:self._row_limit]
+    
+    def _update_accepted_rows(self, invalidate: bool = True):
+        rows = self.shown_rows()
+        self._accepted_rows = None if rows is None else set(rows)
+        if invalidate:
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return self._accepted_rows is None or source_row in self._accepted_rows
+
+
 class SearchResultsWidget(QWidget):
     """
     Widget for displaying search results with table, filtering, and detail view.
@@ -125,6 +292,21 @@ class SearchResultsWidget(QWidget):
         self.current_matches: List[EntityMatch] = []
         self.filtered_matches: List[EntityMatch] = []
         
+        # Per-match filter keys, parallel to current_matches (built in _build_filter_index)
+        self._haystacks: List[str] = []
+        # Types, sources and confidences are numpy arrays when NUMPY_AVAILABLE
+        self._types_lc = []
+        self._sources = []
+        self._confidences = []
+        # Sources currently listed in the source filter (besides "All")
+        self._known_sources = set()
+        
+        # Coalesce keystrokes in the search filter into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.apply_filters)
+        
         self.setup_ui()
         self.setup_connections()
         
@@ -230,9 +412,14 @@ class SearchResultsWidget(QWidget):
         
         table_layout.addLayout(table_controls)
         
-        # Table
-        self.results_table = QTableWidget()
-        self.results_model = SearchResultsTableModel()
+        # Table - a view over the results model, with a proxy for filtering and sorting
+        self.results_table = QTableView()
+        self.results_model = SearchResultsTableModel(self)
+        self.results_proxy = SearchResultsFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortRole(SearchResultsTableModel.SortRole)
+        self.results_table.setModel(self.results_proxy)
+        self.results_table.setItemDelegate(SearchResultsDelegate(self.results_table))
         
         # Configure table - remove alternating colors for better readability
         self.results_table.setAlternatingRowColors(False)
@@ -240,6 +427,19 @@ class SearchResultsWidget(QWidget):
         self.results_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.results_table.setSortingEnabled(True)
         self.results_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        
+        # Uniform row heights let the view lay out rows without measuring each one
+        vertical_header = self.results_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+        self.results_table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        
+        # Make sure name column is not too narrow
+        header = self.results_table.horizontalHeader()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Name column
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)    # Confidence column
+        self.results_table.setColumnWidth(2, 100)
         self.results_table.setVisible(False)  # Initially hidden
         
         table_layout.addWidget(self.results_table)
@@ -279,18 +479,18 @@ class SearchResultsWidget(QWidget):
     def setup_connections(self):
         """Set up signal-slot connections."""
         # Filter connections
-        self.search_filter.textChanged.connect(self.apply_filters)
+        self.search_filter.textChanged.connect(self._filter_timer.start)
         self.type_filter.currentTextChanged.connect(self.apply_filters)
         self.confidence_filter.currentTextChanged.connect(self.apply_filters)
         self.source_filter.currentTextChanged.connect(self.apply_filters)
         self.show_high_confidence_only.toggled.connect(self.apply_filters)
-        self.results_per_page.valueChanged.connect(self.apply_filters)
+        self.results_per_page.valueChanged.connect(self.on_page_size_changed)
         
         # Clear filters
         self.clear_filters_btn.clicked.connect(self.clear_filters)
         
         # Table selection
-        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.results_table.selectionModel().currentRowChanged.connect(self.on_selection_changed)
         
         # Context menu
         self.results_table.customContextMenuRequested.connect(self.show_context_menu)
@@ -316,17 +516,27 @@ class SearchResultsWidget(QWidget):
             search_tags: Optional list of tags used for this search
         """
         self.current_matches = matches
-        self.filtered_matches = matches.copy()
         self.search_tags = search_tags or []
         
+        self._build_filter_index(matches)
+        
         # Update source filter options
         self.update_source_filter()
         
-        # Update table
-        self.update_table()
-        
-        # Update summary
-        self.update_summary()
+        # Freeze the view while it is reset and resized so it repaints once at the end
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            # The model holds the full result set; filters only change which rows the proxy shows.
+            # The proxy gets the new rows before the model reset, so the reset is the only refilter.
+            self.results_proxy.set_accepted_rows(self._filter_rows(), self.results_per_page.value(),
+                                                 invalidate=False)
+            self.results_model.set_matches(matches)
+            self._update_filtered_matches()
+            
+            # Size columns once per result set; filtering leaves the geometry alone
+            self.update_table()
+        finally:
+            self.results_table.setUpdatesEnabled(True)
         
         # Enable/disable export
         self.export_btn.setEnabled(len(matches) > 0)
@@ -347,174 +557,141 @@ class SearchResultsWidget(QWidget):
     
     def update_source_filter(self):
         """Update the source filter dropdown with available sources."""
-        sources = set()
-        for match in self.current_matches:
-            sources.add(match.entity.source)
-        
-        # Clear and repopulate
-        current_selection = self.source_filter.currentText()
-        self.source_filter.clear()
-        self.source_filter.addItem("All")
-        
-        for source in sorted(sources):
-            self.source_filter.addItem(source)
+        sources = {match.entity.source for match in self.current_matches}
+        removed = self._known_sources - sources
+        added = sources - self._known_sources
+        if not removed and not added:
+            return
         
-        # Restore selection if still valid
-        index = self.source_filter.findText(current_selection)
-        if index >= 0:
-            self.source_filter.setCurrentIndex(index)
+        # Only touch the entries that changed; set_results applies the filters afterwards
+        self.source_filter.blockSignals(True)
+        try:
+            if self.source_filter.currentText() in removed:
+                self.source_filter.setCurrentIndex(0)
+            for source in removed:
+                self.source_filter.removeItem(self.source_filter.findText(source))
+            
+            # Insert new sources at their sorted position after "All"
+            listed = [self.source_filter.itemText(i) for i in range(1, self.source_filter.count())]
+            for source in sorted(added):
+                position = bisect.bisect(listed, source)
+                listed.insert(position, source)
+                self.source_filter.insertItem(position + 1, source)
+        finally:
+            self.source_filter.blockSignals(False)
+        
+        self._known_sources = sources
+    
+    def _build_filter_index(self, matches: List[EntityMatch]):
+        """Precompute the lowercase keys the filters compare against, once per result set."""
+        # Name and aliases in one lowercase string, separated by a control character
+        # so a filter cannot match across two names
+        self._haystacks = [
+            "\x1f".join((m.entity.name, *(m.entity.aliases or ()))).lower()
+            for m in matches
+        ]
+        types_lc = [m.entity.entity_type.lower() for m in matches]
+        sources = [m.entity.source for m in matches]
+        confidences = [m.overall_confidence for m in matches]
+        if NUMPY_AVAILABLE:
+            # Column arrays so the exact-match filters compare whole columns at once
+            self._types_lc = np.array(types_lc, dtype=object)
+            self._sources = np.array(sources, dtype=object)
+            self._confidences = np.array(confidences, dtype=np.float64)
+        else:
+            self._types_lc = types_lc
+            self._sources = sources
+            self._confidences = confidences
     
     def apply_filters(self):
         """Apply current filters to the results."""
-        if not self.current_matches:
-            return
-        
-        filtered = self.current_matches.copy()
-        
-        # Search filter
+        # The proxy keeps every matching row and shows the first page of them
+        self.results_proxy.set_accepted_rows(self._filter_rows(), self.results_per_page.value())
+        self._update_filtered_matches()
+    
+    def _filter_rows(self) -> List[int]:
+        """Get the indices of the current matches that pass the filters, in order."""
         search_text = self.search_filter.text().strip().lower()
-        if search_text:
-            filtered = [
-                match for match in filtered
-                if search_text in match.entity.name.lower() or
-                any(search_text in alias.lower() for alias in (match.entity.aliases or []))
-            ]
         
-        # Entity type filter
         entity_type = self.type_filter.currentText()
-        if entity_type != "All":
-            filtered = [
-                match for match in filtered
-                if match.entity.entity_type.lower() == entity_type.lower()
-            ]
-        
-        # Confidence filter
-        confidence_text = self.confidence_filter.currentText()
-        if confidence_text != "0%":
-            min_confidence = float(confidence_text.rstrip('%')) / 100
-            filtered = [
-                match for match in filtered
-                if match.overall_confidence >= min_confidence
-            ]
+        type_lc = entity_type.lower() if entity_type != "All" else None
         
-        # Source filter
         source = self.source_filter.currentText()
-        if source != "All":
-            filtered = [
-                match for match in filtered
-                if match.entity.source == source
-            ]
+        source = source if source != "All" else None
         
-        # High confidence only filter
+        confidence_text = self.confidence_filter.currentText()
+        min_confidence = float(confidence_text.rstrip('%')) / 100 if confidence_text != "0%" else 0.0
         if self.show_high_confidence_only.isChecked():
-            filtered = [
-                match for match in filtered
-                if match.overall_confidence >= 0.8
-            ]
-        
-        # Limit results
-        max_results = self.results_per_page.value()
-        if len(filtered) > max_results:
-            filtered = filtered[:max_results]
-        
-        self.filtered_matches = filtered
-        self.update_table()
+            min_confidence = max(min_confidence, 0.8)
+        
+        haystacks, types_lc = self._haystacks, self._types_lc
+        sources, confidences = self._sources, self._confidences
+        # Only active filters run, cheapest first, each over the rows that survived the previous
+        # one, so the substring test runs last on the smallest set
+        if NUMPY_AVAILABLE:
+            mask = confidences >= min_confidence
+            if type_lc:
+                mask &= types_lc == type_lc
+            if source:
+                mask &= sources == source
+            rows = np.flatnonzero(mask).tolist()
+        else:
+            rows = range(len(haystacks))
+            if min_confidence > 0:
+                rows = [i for i in rows if confidences[i] >= min_confidence]
+            if type_lc:
+                rows = [i for i in rows if types_lc[i] == type_lc]
+            if source:
+                rows = [i for i in rows if sources[i] == source]
+        
+        # Substring tests do not vectorise, so the name filter is always a Python pass
+        if search_text:
+            rows = [i for i in rows if search_text in haystacks[i]]
+        return list(rows)
+    
+    def on_page_size_changed(self, value: int):
+        """Show a different number of the already-filtered results."""
+        self.results_proxy.set_row_limit(value)
+        self._update_filtered_matches()
+    
+    def _update_filtered_matches(self):
+        """Sync filtered_matches and the summary with the rows the proxy shows."""
+        rows = self.results_proxy.shown_rows()
+        if rows is None:
+            self.filtered_matches = list(self.current_matches)
+        else:
+            self.filtered_matches = [self.current_matches[i] for i in rows]
         self.update_summary()
     
     def clear_filters(self):
         """Clear all filters."""
-        self.search_filter.clear()
-        self.type_filter.setCurrentIndex(0)
-        self.confidence_filter.setCurrentIndex(0)
-        self.source_filter.setCurrentIndex(0)
-        self.show_high_confidence_only.setChecked(False)
-        self.results_per_page.setValue(100)
+        # Reset every filter widget silently, then filter once
+        blockers = [
+            QSignalBlocker(widget) for widget in (
+                self.search_filter, self.type_filter, self.confidence_filter,
+                self.source_filter, self.show_high_confidence_only, self.results_per_page
+            )
+        ]
+        try:
+            self.search_filter.clear()
+            self.type_filter.setCurrentIndex(0)
+            self.confidence_filter.setCurrentIndex(0)
+            self.source_filter.setCurrentIndex(0)
+            self.show_high_confidence_only.setChecked(False)
+            self.results_per_page.setValue(100)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        
+        self._filter_timer.stop()
+        self.apply_filters()
     
     def update_table(self):
-        """Update the table with filtered results."""
-        # Clear existing table
-        self.results_table.setRowCount(0)
-        self.results_table.setColumnCount(len(SearchResultsTableModel.COLUMNS))
-        
-        # Set headers
-        headers = [col[0] for col in SearchResultsTableModel.COLUMNS]
-        self.results_table.setHorizontalHeaderLabels(headers)
-        
-        # Populate table
-        self.results_table.setRowCount(len(self.filtered_matches))
-        
-        for row, match in enumerate(self.filtered_matches):
-            # Name
-            name_item = QTableWidgetItem(match.entity.name)
-            name_item.setData(Qt.ItemDataRole.UserRole, match)
-            self.results_table.setItem(row, 0, name_item)
-            
-            # Type
-            type_item = QTableWidgetItem(match.entity.entity_type.title())
-            self.results_table.setItem(row, 1, type_item)
-            
-            # Confidence with emoji indicator
-            confidence_text = f"{match.overall_confidence:.1%}"
-            if match.overall_confidence >= 0.8:
-                confidence_text = f"🔴 {confidence_text}"  # High confidence
-            elif match.overall_confidence >= 0.6:
-                confidence_text = f"🟠 {confidence_text}"  # Medium confidence
-            elif match.overall_confidence >= 0.4:
-                confidence_text = f"🟡 {confidence_text}"  # Low confidence
-            else:
-                confidence_text = f"⚪ {confidence_text}"  # Very low confidence
-            
-            confidence_item = QTableWidgetItem(confidence_text)
-            confidence_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.results_table.setItem(row, 2, confidence_item)
-            
-            # Source
-            source_item = QTableWidgetItem(match.entity.source)
-            self.results_table.setItem(row, 3, source_item)
-            
-            # Sanctions Type
-            sanctions_item = QTableWidgetItem(match.entity.sanctions_type)
-            self.results_table.setItem(row, 4, sanctions_item)
-            
-            # Effective Date
-            if match.entity.effective_date:
-                date_str = match.entity.effective_date.strftime('%Y-%m-%d')
-            else:
-                date_str = 'N/A'
-            date_item = QTableWidgetItem(date_str)
-            self.results_table.setItem(row, 5, date_item)
-            
-            # Best Algorithm
-            if match.confidence_scores:
-                best_alg, best_score = max(match.confidence_scores.items(), key=lambda x: x[1])
-                alg_text = f"{best_alg.title()} ({best_score:.1%})"
-            else:
-                alg_text = 'N/A'
-            alg_item = QTableWidgetItem(alg_text)
-            self.results_table.setItem(row, 6, alg_item)
-            
-            # Set row background color based on confidence
-            bg_color = self._get_confidence_color(match.overall_confidence)
-            for col in range(self.results_table.columnCount()):
-                item = self.results_table.item(row, col)
-                if item:
-                    item.setBackground(bg_color)
-        
-        # Resize columns to content
+        """Update the table column widths for a new result set."""
+        # Resize columns to content, keeping the fixed confidence column width
         self.results_table.resizeColumnsToContents()
-        
-        # Make sure name column is not too narrow
-        header = self.results_table.horizontalHeader()
-        header.setStretchLastSection(False)
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Name column
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)    # Confidence column
         self.results_table.setColumnWidth(2, 100)
     
-    def _get_confidence_color(self, confidence: float) -> QColor:
-        """Get background color based on confidence level - using transparent for better readability."""
-        # Return transparent color to avoid white backgrounds that make text hard to read
-        return QColor(0, 0, 0, 0)  # Transparent
-    
     def update_summary(self):
         """Update the summary label."""
         total = len(self.current_matches)
@@ -527,21 +704,11 @@ class SearchResultsWidget(QWidget):
         else:
             self.summary_label.setText(f"{filtered} of {total} result{'s' if total != 1 else ''}")
     
-    def on_selection_changed(self):
-        """Handle table selection changes."""
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
-            self.detail_text.clear()
-            return
-        
-        # Get the match from the first column of the selected row
-        row = selected_items[0].row()
-        name_item = self.results_table.item(row, 0)
-        if not name_item:
-            return
-        
-        match = name_item.data(Qt.ItemDataRole.UserRole)
+    def on_selection_changed(self, current: QModelIndex, previous: QModelIndex = None):
+        """Handle changes of the current table row."""
+        match = current.data(Qt.ItemDataRole.UserRole) if current.isValid() else None
         if not match:
+            self.detail_text.clear()
             return
         
         self.show_match_details(match)
@@ -553,66 +720,67 @@ class SearchResultsWidget(QWidget):
         Args:
             match: EntityMatch object to display
         """
-        details = []
-        
-        # Basic entity information
-        details.append(f"<h3>{match.entity.name}</h3>")
-        details.append(f"<b>Type:</b> {match.entity.entity_type.title()}")
-        details.append(f"<b>Source:</b> {match.entity.source} (v{match.entity.source_version})")
-        details.append(f"<b>Sanctions Type:</b> {match.entity.sanctions_type}")
-        
-        if match.entity.effective_date:
-            details.append(f"<b>Effective Date:</b> {match.entity.effective_date.strftime('%Y-%m-%d')}")
+        entity = match.entity
+        context = {
+            'name': entity.name,
+            'entity_type': entity.entity_type.title(),
+            'source': entity.source,
+            'source_version': entity.source_version,
+            'sanctions_type': entity.sanctions_type,
+            'overall_confidence': match.overall_confidence,
+            'matched_name': match.matched_name,
+            'effective_date_block': '',
+            'aliases_block': '',
+            'scores_block': '',
+            'normalization_block': '',
+            'additional_info_block': '',
+        }
+        
+        if entity.effective_date:
+            context['effective_date_block'] = f"<b>Effective Date:</b> {entity.effective_date.strftime('%Y-%m-%d')}<br>"
         
         # Aliases
-        if match.entity.aliases:
-            aliases_text = ", ".join(match.entity.aliases[:5])  # Show first 5 aliases
-            if len(match.entity.aliases) > 5:
-                aliases_text += f" (and {len(match.entity.aliases) - 5} more)"
-            details.append(f"<b>Aliases:</b> {aliases_text}")
-        
-        details.append("")  # Empty line
-        
-        # Matching information
-        details.append(f"<h4>Match Analysis</h4>")
-        details.append(f"<b>Overall Confidence:</b> {match.overall_confidence:.1%}")
-        details.append(f"<b>Matched Name:</b> {match.matched_name}")
+        if entity.aliases:
+            aliases_text = ", ".join(entity.aliases[:5])  # Show first 5 aliases
+            if len(entity.aliases) > 5:
+                aliases_text += f" (and {len(entity.aliases) - 5} more)"
+            context['aliases_block'] = f"<b>Aliases:</b> {aliases_text}<br>"
         
         # Algorithm scores
-        if match.confidence_scores:
-            details.append("<b>Algorithm Scores:</b>")
-            for algorithm, score in sorted(match.confidence_scores.items(), key=lambda x: x[1], reverse=True):
-                details.append(f"  • {algorithm.title()}: {score:.1%}")
+        ranked_scores = self.results_model.get_ranked_scores(match)
+        if ranked_scores:
+            context['scores_block'] = "<br><b>Algorithm Scores:</b>" + "".join(
+                f"<br>  • {algorithm.title()}: {score:.1%}"
+                for algorithm, score in ranked_scores
+            )
         
         # Match details
         if match.match_details:
-            original_query = match.match_details.get('original_query', 'N/A')
-            normalized_query = match.match_details.get('normalized_query', 'N/A')
-            original_name = match.match_details.get('original_name', 'N/A')
-            normalized_name = match.match_details.get('normalized_name', 'N/A')
-            
-            details.append("")
-            details.append("<b>Normalization:</b>")
-            details.append(f"  Query: '{original_query}' → '{normalized_query}'")
-            details.append(f"  Entity: '{original_name}' → '{normalized_name}'")
+            context['normalization_block'] = (
+                "<br><br><b>Normalization:</b>"
+                f"<br>  Query: '{match.match_details.get('original_query', 'N/A')}' → "
+                f"'{match.match_details.get('normalized_query', 'N/A')}'"
+                f"<br>  Entity: '{match.match_details.get('original_name', 'N/A')}' → "
+                f"'{match.match_details.get('normalized_name', 'N/A')}'"
+            )
         
         # Additional info
-        if match.entity.additional_info:
-            details.append("")
-            details.append("<b>Additional Information:</b>")
-            for key, value in match.entity.additional_info.items():
-                if isinstance(value, str) and len(value) < 100:
-                    details.append(f"  • {key.title()}: {value}")
+        if entity.additional_info:
+            context['additional_info_block'] = "<br><br><b>Additional Information:</b>" + "".join(
+                f"<br>  • {key.title()}: {value}"
+                for key, value in entity.additional_info.items()
+                if isinstance(value, str) and len(value) < 100
+            )
         
-        self.detail_text.setHtml("<br>".join(details))
+        self.detail_text.setHtml(_DETAIL_TEMPLATE.format_map(context))
     
     def show_context_menu(self, position):
         """Show context menu for table."""
-        item = self.results_table.itemAt(position)
-        if not item:
+        index = self.results_table.indexAt(position)
+        if not index.isValid():
             return
         
-        match = self.results_table.item(item.row(), 0).data(Qt.ItemDataRole.UserRole)
+        match = index.data(Qt.ItemDataRole.UserRole)
         if not match:
             return
         
@@ -679,21 +847,19 @@ class SearchResultsWidget(QWidget):
     
     def get_selected_match(self) -> Optional[EntityMatch]:
         """Get the currently selected match."""
-        selected_items = self.results_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.results_table.selectionModel().selectedRows()
+        if not selected_rows:
             return None
         
-        row = selected_items[0].row()
-        name_item = self.results_table.item(row, 0)
-        if name_item:
-            return name_item.data(Qt.ItemDataRole.UserRole)
-        return None
+        return selected_rows[0].data(Qt.ItemDataRole.UserRole)
     
     def clear_results(self):
         """Clear all results."""
         self.current_matches = []
         self.filtered_matches = []
-        self.results_table.setRowCount(0)
+        self._build_filter_index([])
+        self.results_proxy.set_accepted_rows(None, invalidate=False)
+        self.results_model.set_matches([])
         self.detail_text.clear()
         self.summary_label.setText("No results")
         self.export_btn.setEnabled(False)
@@ -3,26 +3,206 @@ Settings widget for the Sanctions Checker application.
 Provides configuration interface for thresholds, data sources, and user preferences.
 """
 
+import json
 import logging
+import os
+import platform
+import re
+import subprocess
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QFormLayout,
     QLabel, QLineEdit, QPushButton, QComboBox, QSpinBox, QDoubleSpinBox,
-    QCheckBox, QGroupBox, QTabWidget, QScrollArea, QFrame, QMessageBox,
-    QFileDialog, QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
-    QTextEdit, QSlider, QProgressBar
+    QCheckBox, QGroupBox, QTabWidget, QScrollArea, QMessageBox,
+    QFileDialog, QTableView, QHeaderView, QAbstractItemView,
+    QTextEdit, QSlider, QStyledItemDelegate, QStyleOptionButton,
+    QStyle, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer, pyqtSlot
-from PyQt6.QtGui import QFont, QValidator, QDoubleValidator, QIntValidator
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, pyqtSlot, QAbstractTableModel, QModelIndex, QEvent, QSize,
+    QObject, QRunnable, QThreadPool, QSignalBlocker, QRegularExpression
+)
+from PyQt6.QtGui import QFont, QImage, QDoubleValidator, QRegularExpressionValidator
 
 from sanctions_checker.config import Config
 from sanctions_checker.utils.resources import resource_manager
-from .logo_upload_dialog import LogoUploadDialog
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Marks config keys that are not set, so missing keys can be cached too
+_MISSING = object()
+
+def _select_text(combo: QComboBox, text: str):
+    """Select the combo box item with the given text, if there is one."""
+    index = combo.findText(text)
+    if index >= 0:
+        combo.setCurrentIndex(index)
+
+
+def _lowercase_choice(display):
+    """Field kind for a combo box whose config value is its item text lowercased."""
+    return ('currentTextChanged', lambda combo: combo.currentText().lower(),
+            lambda combo, value: _select_text(combo, display(value)))
+
+
+# Field kinds: (change signal, read the config value from the widget, show a config value)
+_NUMBER_FIELD = ('valueChanged', lambda spinbox: spinbox.value(),
+                 lambda spinbox, value: spinbox.setValue(value))
+_FLAG_FIELD = ('toggled', lambda checkbox: checkbox.isChecked(),
+               lambda checkbox, value: checkbox.setChecked(value))
+_TEXT_FIELD = ('textChanged', lambda edit: edit.text().strip(),
+               lambda edit, value: edit.setText(value))
+_CHOICE_FIELD = ('currentTextChanged', lambda combo: combo.currentText(), _select_text)
+
+# Settings edited through a single field: (config key, widget attribute, field kind, default).
+# Drives change detection, loading, saving and the reset snapshot.
+_SETTINGS_SPEC = (
+    # Matching tab
+    ('matching.levenshtein_threshold', 'levenshtein_threshold', _NUMBER_FIELD, 0.8),
+    ('matching.jaro_winkler_threshold', 'jaro_winkler_threshold', _NUMBER_FIELD, 0.85),
+    ('matching.company_threshold', 'company_threshold', _NUMBER_FIELD, 0.75),
+    ('matching.individual_threshold', 'individual_threshold', _NUMBER_FIELD, 0.8),
+    ('matching.soundex_enabled', 'soundex_enabled', _FLAG_FIELD, True),
+    # Data sources tab
+    ('updates.auto_update', 'auto_update_enabled', _FLAG_FIELD, True),
+    ('updates.update_interval_hours', 'update_interval', _NUMBER_FIELD, 24),
+    ('updates.retry_attempts', 'retry_attempts', _NUMBER_FIELD, 3),
+    ('updates.retry_delay_seconds', 'retry_delay', _NUMBER_FIELD, 300),
+    # Preferences tab
+    ('reports.default_format', 'default_format', _lowercase_choice(str.upper), 'pdf'),
+    ('reports.include_algorithm_details', 'include_algorithm_details', _FLAG_FIELD, True),
+    ('reports.include_verification_hash', 'include_verification_hash', _FLAG_FIELD, True),
+    ('audit.retention_days', 'retention_days', _NUMBER_FIELD, 365),
+    ('audit.log_searches', 'log_searches', _FLAG_FIELD, True),
+    ('audit.log_level', 'log_level', _CHOICE_FIELD, 'INFO'),
+    ('gui.theme', 'theme', _lowercase_choice(str.title), 'default'),
+    ('gui.window_width', 'window_width', _NUMBER_FIELD, 1200),
+    ('gui.window_height', 'window_height', _NUMBER_FIELD, 800),
+    ('gui.auto_save_searches', 'auto_save_searches', _FLAG_FIELD, True),
+    # Advanced tab
+    ('database.url', 'database_url', _TEXT_FIELD, ''),
+    ('database.echo', 'database_echo', _FLAG_FIELD, False),
+)
+
+# Settings restored by reset_settings, read once per load into original_config
+_ORIGINAL_KEYS = tuple(key for key, _attr, _kind, _default in _SETTINGS_SPEC)
+_SETTING_DEFAULTS = MappingProxyType({key: default for key, _attr, _kind, default in _SETTINGS_SPEC})
+
+# Operating system name, looked up once for opening folders
+_SYSTEM = platform.system()
+
+# URL schemes accepted for the database URL setting
+_DB_URL_SCHEMES = ('sqlite://', 'postgresql://', 'mysql://')
+
+# Search tag names: letters, digits, spaces, '_', '-' and '.', at most 64 characters
+_TAG_NAME_PATTERN = r'^[\w \-.]{1,64}$'
+_TAG_NAME_RE = re.compile(_TAG_NAME_PATTERN)
+
+
+def _parse_config_json(text: str):
+    """Parse raw config JSON, using orjson when available. Raises json.JSONDecodeError if invalid."""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _open_in_file_manager(path: str):
+    """Open a folder in the platform's file manager."""
+    if _SYSTEM == "Windows":
+        os.startfile(path)
+    elif _SYSTEM == "Darwin":  # macOS
+        subprocess.run(["open", path])
+    else:  # Linux
+        subprocess.run(["xdg-open", path])
+
+
+def _read_config_json(filename: str):
+    """Read a JSON config file, using orjson when available. Raises json.JSONDecodeError if invalid."""
+    if ORJSON_AVAILABLE:
+        with open(filename, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _dump_config_json(data: Dict[str, Any]) -> str:
+    """Serialize config data as indented JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _write_config_json(data: Dict[str, Any], filename: str):
+    """Write config data to a file as indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # json.dump streams the encoded chunks to the file
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+# Applied once to the settings widget; styled children are selected by objectName
+_SETTINGS_STYLE_SHEET = """
+    QLabel#settingsStatus { color: green; font-weight: bold; }
+    QLabel#settingsError { color: red; font-weight: bold; }
+    QLabel#logoPreview { border: 1px solid #ccc; background: white; padding: 10px; }
+    QLabel#logoStatus[state="ok"] { color: green; }
+    QLabel#logoStatus[state="placeholder"] { color: orange; }
+    QLabel#logoStatus[state="error"] { color: red; }
+    QLabel#logoUsageInfo {
+        color: #666; font-size: 11px; padding: 10px; background: #f9f9f9; border-radius: 5px;
+    }
+    QLabel#tagDescription { color: #666; font-size: 11px; padding: 5px; }
+    QLabel#configFilePath { font-family: monospace; background-color: #f0f0f0; padding: 5px; }
+    QLabel#rawConfigWarning { color: orange; font-weight: bold; }
+    QPushButton#coffeeButton {
+        background-color: #FFDD00;
+        border: 2px solid #FF813F;
+        border-radius: 12px;
+        padding: 12px 24px;
+        font-weight: bold;
+        font-size: 14px;
+        color: #000000;
+        min-height: 20px;
+    }
+    QPushButton#coffeeButton:hover {
+        background-color: #FF813F;
+        color: #FFFFFF;
+        transform: scale(1.05);
+    }
+    QPushButton#coffeeButton:pressed {
+        background-color: #E6730F;
+    }
+    QLabel#supportBenefits { color: #666; font-style: italic; }
+"""
+
+
+@lru_cache(maxsize=None)
+def _bold_font(point_size: int) -> QFont:
+    """Get a shared bold font; built on first use since fonts need a running QApplication."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _monospace_font() -> QFont:
+    """Get the shared font for the raw configuration editor."""
+    return QFont("Courier", 10)
+
 
 class ThresholdValidator(QDoubleValidator):
     """Custom validator for threshold values (0.0 to 1.0)."""
@@ -32,6 +212,206 @@ class ThresholdValidator(QDoubleValidator):
         self.setNotation(QDoubleValidator.Notation.StandardNotation)
 
 
+class LogoLoadSignals(QObject):
+    """Signals emitted by LogoLoadTask."""
+    
+    loaded = pyqtSignal(int, object, object)  # generation, file stamp, QImage (None if no logo)
+
+
+class LogoLoadTask(QRunnable):
+    """Runnable that reads and scales the logo image off the UI thread."""
+    
+    def __init__(self, generation: int, width: int, dpr: float):
+        super().__init__()
+        self.generation = generation
+        self.width = width
+        self.dpr = dpr
+        self.signals = LogoLoadSignals()
+    
+    def run(self):
+        """Load the logo and report it back to the UI thread."""
+        try:
+            stamp, image = resource_manager.load_logo_image(width=self.width, dpr=self.dpr)
+        except Exception as e:
+            logger.error("Failed to load logo preview: %s", e)
+            stamp, image = None, None
+        self.signals.loaded.emit(self.generation, stamp, image)
+
+
+class DataSourcesTableModel(QAbstractTableModel):
+    """Table model for the configured sanctions data sources."""
+    
+    HEADERS = ["Source", "URL", "Format", "Enabled"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [name, url, format, enabled]
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self._rows[index.row()]
+        column = index.column()
+        if column == 3:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if row[3] else Qt.CheckState.Unchecked
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return row[column]
+        return None
+    
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        
+        row = self._rows[index.row()]
+        column = index.column()
+        if column == 3 and role == Qt.ItemDataRole.CheckStateRole:
+            row[3] = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif column in (1, 2) and role == Qt.ItemDataRole.EditRole:
+            row[column] = value
+        else:
+            return False
+        
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() in (1, 2):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        elif index.column() == 3:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+    
+    def set_sources(self, data_sources: Dict[str, Dict[str, Any]]):
+        """
+        Replace the rows with the given data_sources configuration.
+        
+        If the same sources are listed in the same order, only the rows whose values
+        changed are updated, keeping the view's selection and scroll position.
+        """
+        rows = [
+            [name, source.get('url', ''), source.get('format', ''), source.get('enabled', True)]
+            for name, source in data_sources.items()
+        ]
+        if [row[0] for row in rows] != [row[0] for row in self._rows]:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        changed = [i for i, (old, new) in enumerate(zip(self._rows, rows)) if old != new]
+        if not changed:
+            return
+        self._rows = rows
+        self.dataChanged.emit(self.index(changed[0], 0),
+                              self.index(changed[-1], len(self.HEADERS) - 1))
+    
+    def to_config(self) -> Dict[str, Dict[str, Any]]:
+        """Get the rows as a data_sources configuration."""
+        return {
+            name: {'url': url, 'format': fmt, 'enabled': enabled}
+            for name, url, fmt, enabled in self._rows
+        }
+    
+    def source_url(self, row: int) -> str:
+        """Get the URL of the source at row."""
+        return self._rows[row][1]
+    
+    def remove_source(self, row: int):
+        """Remove the source at row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+
+class TagTableModel(QAbstractTableModel):
+    """Table model listing search tags, with a Remove action column."""
+    
+    HEADERS = ["Tag Name", "Actions"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tags = ()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return len(self._tags)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._tags[index.row()] if index.column() == 0 else "Remove"
+    
+    def set_tags(self, tags):
+        """Replace the listed tags; nothing is reset if they are unchanged."""
+        tags = tuple(tags)
+        if tags == self._tags:
+            return
+        self.beginResetModel()
+        self._tags = tags
+        self.endResetModel()
+    
+    def tag(self, row: int) -> str:
+        """Get the tag at row."""
+        return self._tags[row]
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Item delegate that paints a cell as a push button and reports clicks on it."""
+    
+    clicked = pyqtSignal(QModelIndex)
+    
+    def _button_option(self, option, index: QModelIndex) -> QStyleOptionButton:
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data() or ""
+        button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+        return button
+    
+    def _style(self, option) -> QStyle:
+        return option.widget.style() if option.widget else QApplication.style()
+    
+    def paint(self, painter, option, index: QModelIndex):
+        self._style(option).drawControl(
+            QStyle.ControlElement.CE_PushButton, self._button_option(option, index), painter, option.widget
+        )
+    
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        button = self._button_option(option, index)
+        text_size = option.fontMetrics.size(0, button.text)
+        return self._style(option).sizeFromContents(
+            QStyle.ContentsType.CT_PushButton, button, text_size, option.widget
+        )
+    
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and option.rect.contains(event.position().toPoint())):
+            self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
 class SettingsWidget(QWidget):
     """Settings configuration widget."""
     
@@ -55,16 +435,47 @@ class SettingsWidget(QWidget):
         self.validation_timer.setSingleShot(True)
         self.validation_timer.timeout.connect(self._validate_all_settings)
         
+        # Coalesce bursts of field changes (e.g. slider drags) into one dirty update
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(50)
+        self._dirty_timer.timeout.connect(self._mark_settings_dirty)
+        
+        # Line edits report a change once typing pauses rather than per keystroke
+        self._typing_timer = QTimer(self)
+        self._typing_timer.setSingleShot(True)
+        self._typing_timer.setInterval(300)
+        self._typing_timer.timeout.connect(self._on_setting_changed)
+        
         # Track unsaved changes
         self.has_unsaved_changes = False
+        self._loading = False  # True while load_current_settings fills the fields
         self.field_validators = {}
         
+        # Config values read by this widget, keyed by dotted config key
+        self._cfg_cache: Dict[str, Any] = {}
+        
+        # Search tags as last read from or written to the config
+        self._tags_cache = []
+        
+        # Incremented per logo preview request so stale background loads are ignored
+        self._logo_load_generation = 0
+        
+        # Information box for the data source actions, created on first use
+        self._info_box = None
+        
+        # Parsed config from the last successful raw config validation; valid while the
+        # editor's document is unmodified since then
+        self._raw_cache: Optional[Dict[str, Any]] = None
+        
         self.setup_ui()
-        self.load_current_settings()
         self.setup_connections()
+        # Fill the fields once the event loop runs, so the window can show first
+        QTimer.singleShot(0, self.load_current_settings)
     
     def setup_ui(self):
         """Set up the user interface."""
+        self.setStyleSheet(_SETTINGS_STYLE_SHEET)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.setSpacing(10)
@@ -73,10 +484,7 @@ class SettingsWidget(QWidget):
         header_layout = QHBoxLayout()
         
         title = QLabel("Settings")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_bold_font(16))
         header_layout.addWidget(title)
         
         header_layout.addStretch()
@@ -95,12 +503,12 @@ class SettingsWidget(QWidget):
         
         # Status/validation message area
         self.status_label = QLabel()
-        self.status_label.setStyleSheet("color: green; font-weight: bold;")
+        self.status_label.setObjectName("settingsStatus")
         self.status_label.setVisible(False)
         layout.addWidget(self.status_label)
         
         self.error_label = QLabel()
-        self.error_label.setStyleSheet("color: red; font-weight: bold;")
+        self.error_label.setObjectName("settingsError")
         self.error_label.setWordWrap(True)
         self.error_label.setVisible(False)
         layout.addWidget(self.error_label)
@@ -109,53 +517,98 @@ class SettingsWidget(QWidget):
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
         
-        # Create individual setting tabs
-        self._create_matching_tab()
-        self._create_data_sources_tab()
-        self._create_branding_tab()
-        self._create_preferences_tab()
-        self._create_advanced_tab()
-        self._create_support_tab()
+        # Create individual setting tabs. Branding and Support are not part of the
+        # loaded/saved settings, so they are built the first time they are shown.
+        self._lazy_tabs = {}  # placeholder widget -> populate function for the tab
+        self._make_scroll_tab(self._populate_matching_tab, "Matching")
+        self._make_scroll_tab(self._populate_data_sources_tab, "Data Sources")
+        self._add_lazy_tab(self._populate_branding_tab, "🎨 Branding")
+        self._make_scroll_tab(self._populate_preferences_tab, "Preferences")
+        self._make_scroll_tab(self._populate_advanced_tab, "Advanced")
+        self._add_lazy_tab(self._populate_support_tab, "☕ Support")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
     
-    def _create_matching_tab(self):
-        """Create matching algorithms configuration tab."""
+    def _threshold_spinbox(self) -> QDoubleSpinBox:
+        """Create a spin box for a 0.0-1.0 matching threshold."""
+        spinbox = QDoubleSpinBox()
+        spinbox.setRange(0.0, 1.0)
+        spinbox.setSingleStep(0.05)
+        spinbox.setDecimals(2)
+        spinbox.setSuffix(" (0.0-1.0)")
+        # Report a value once editing finishes, not on every keystroke
+        spinbox.setKeyboardTracking(False)
+        return spinbox
+    
+    def _int_spinbox(self, minimum: int, maximum: int, suffix: str = "") -> QSpinBox:
+        """Create an integer spin box with the given range and unit suffix."""
+        spinbox = QSpinBox()
+        spinbox.setRange(minimum, maximum)
+        spinbox.setSuffix(suffix)
+        spinbox.setKeyboardTracking(False)
+        return spinbox
+    
+    def _make_scroll_tab(self, populate, title: Optional[str] = None) -> QScrollArea:
+        """
+        Build a scrollable settings tab whose contents are added by populate.
+        
+        Args:
+            populate: Callable filling the tab's QVBoxLayout
+            title: Tab title; if given the tab is appended to the tab widget
+        """
         tab = QScrollArea()
         tab_widget = QWidget()
         tab_layout = QVBoxLayout(tab_widget)
+        populate(tab_layout)
+        tab_layout.addStretch()
+        tab.setWidget(tab_widget)
+        tab.setWidgetResizable(True)
+        if title is not None:
+            self.tabs.addTab(tab, title)
+        return tab
+    
+    def _add_lazy_tab(self, populate, title: str):
+        """Add a placeholder tab whose contents are built by populate on first activation."""
+        placeholder = QWidget()
+        self._lazy_tabs[placeholder] = populate
+        self.tabs.addTab(placeholder, title)
+    
+    def _ensure_tab_built(self, index: int):
+        """Replace a placeholder tab with its real contents the first time it is shown."""
+        placeholder = self.tabs.widget(index)
+        populate = self._lazy_tabs.pop(placeholder, None)
+        if populate is None:
+            return
         
+        tab = self._make_scroll_tab(populate)
+        title = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, tab, title)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def _populate_matching_tab(self, tab_layout: QVBoxLayout):
+        """Populate the matching algorithms configuration tab."""
         # Threshold Configuration Group
         threshold_group = QGroupBox("Matching Thresholds")
         threshold_layout = QFormLayout(threshold_group)
         
         # Levenshtein threshold
-        self.levenshtein_threshold = QDoubleSpinBox()
-        self.levenshtein_threshold.setRange(0.0, 1.0)
-        self.levenshtein_threshold.setSingleStep(0.05)
-        self.levenshtein_threshold.setDecimals(2)
-        self.levenshtein_threshold.setSuffix(" (0.0-1.0)")
+        self.levenshtein_threshold = self._threshold_spinbox()
         threshold_layout.addRow("Levenshtein Distance Threshold:", self.levenshtein_threshold)
         
         # Jaro-Winkler threshold
-        self.jaro_winkler_threshold = QDoubleSpinBox()
-        self.jaro_winkler_threshold.setRange(0.0, 1.0)
-        self.jaro_winkler_threshold.setSingleStep(0.05)
-        self.jaro_winkler_threshold.setDecimals(2)
-        self.jaro_winkler_threshold.setSuffix(" (0.0-1.0)")
+        self.jaro_winkler_threshold = self._threshold_spinbox()
         threshold_layout.addRow("Jaro-Winkler Threshold:", self.jaro_winkler_threshold)
         
         # Company vs Individual thresholds
-        self.company_threshold = QDoubleSpinBox()
-        self.company_threshold.setRange(0.0, 1.0)
-        self.company_threshold.setSingleStep(0.05)
-        self.company_threshold.setDecimals(2)
-        self.company_threshold.setSuffix(" (0.0-1.0)")
+        self.company_threshold = self._threshold_spinbox()
         threshold_layout.addRow("Company Matching Threshold:", self.company_threshold)
         
-        self.individual_threshold = QDoubleSpinBox()
-        self.individual_threshold.setRange(0.0, 1.0)
-        self.individual_threshold.setSingleStep(0.05)
-        self.individual_threshold.setDecimals(2)
-        self.individual_threshold.setSuffix(" (0.0-1.0)")
+        self.individual_threshold = self._threshold_spinbox()
         threshold_layout.addRow("Individual Matching Threshold:", self.individual_threshold)
         
         tab_layout.addWidget(threshold_group)
@@ -190,26 +643,18 @@ class SettingsWidget(QWidget):
         visual_layout.addWidget(self.jaro_winkler_slider, 1, 1)
         
         tab_layout.addWidget(visual_group)
-        
-        tab_layout.addStretch()
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "Matching")
     
-    def _create_data_sources_tab(self):
-        """Create data sources configuration tab."""
-        tab = QScrollArea()
-        tab_widget = QWidget()
-        tab_layout = QVBoxLayout(tab_widget)
-        
+    def _populate_data_sources_tab(self, tab_layout: QVBoxLayout):
+        """Populate the data sources configuration tab."""
         # Data Sources Table
         sources_group = QGroupBox("Sanctions Data Sources")
         sources_layout = QVBoxLayout(sources_group)
         
         # Table for data sources
-        self.sources_table = QTableWidget()
-        self.sources_table.setColumnCount(4)
-        self.sources_table.setHorizontalHeaderLabels(["Source", "URL", "Format", "Enabled"])
+        self.sources_model = DataSourcesTableModel(self)
+        self.sources_table = QTableView()
+        self.sources_table.setModel(self.sources_model)
+        self.sources_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         
         # Make table responsive
         header = self.sources_table.horizontalHeader()
@@ -245,33 +690,20 @@ class SettingsWidget(QWidget):
         update_layout.addRow(self.auto_update_enabled)
         
         # Update interval
-        self.update_interval = QSpinBox()
-        self.update_interval.setRange(1, 168)  # 1 hour to 1 week
-        self.update_interval.setSuffix(" hours")
+        self.update_interval = self._int_spinbox(1, 168, " hours")  # 1 hour to 1 week
         update_layout.addRow("Update Interval:", self.update_interval)
         
         # Retry settings
-        self.retry_attempts = QSpinBox()
-        self.retry_attempts.setRange(1, 10)
+        self.retry_attempts = self._int_spinbox(1, 10)
         update_layout.addRow("Retry Attempts:", self.retry_attempts)
         
-        self.retry_delay = QSpinBox()
-        self.retry_delay.setRange(30, 3600)  # 30 seconds to 1 hour
-        self.retry_delay.setSuffix(" seconds")
+        self.retry_delay = self._int_spinbox(30, 3600, " seconds")  # 30 seconds to 1 hour
         update_layout.addRow("Retry Delay:", self.retry_delay)
         
         tab_layout.addWidget(update_group)
-        
-        tab_layout.addStretch()
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "Data Sources")
     
-    def _create_branding_tab(self):
-        """Create branding and logo configuration tab."""
-        tab = QScrollArea()
-        tab_widget = QWidget()
-        tab_layout = QVBoxLayout(tab_widget)
+    def _populate_branding_tab(self, tab_layout: QVBoxLayout):
+        """Populate the branding and logo configuration tab."""
         tab_layout.setSpacing(15)
         
         # Logo Management Section
@@ -285,13 +717,14 @@ class SettingsWidget(QWidget):
         self.logo_preview_label = QLabel()
         self.logo_preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.logo_preview_label.setMinimumHeight(100)
-        self.logo_preview_label.setStyleSheet("border: 1px solid #ccc; background: white; padding: 10px;")
+        self.logo_preview_label.setObjectName("logoPreview")
         logo_display_layout.addWidget(self.logo_preview_label)
         
         # Logo info and controls
         logo_info_layout = QVBoxLayout()
         
         self.logo_status_label = QLabel()
+        self.logo_status_label.setObjectName("logoStatus")
         self.logo_status_label.setWordWrap(True)
         logo_info_layout.addWidget(self.logo_status_label)
         
@@ -320,7 +753,7 @@ class SettingsWidget(QWidget):
             "• Main application interface\n"
             "• About dialog and documentation"
         )
-        usage_info.setStyleSheet("color: #666; font-size: 11px; padding: 10px; background: #f9f9f9; border-radius: 5px;")
+        usage_info.setObjectName("logoUsageInfo")
         logo_layout.addWidget(usage_info)
         
         tab_layout.addWidget(logo_group)
@@ -366,21 +799,18 @@ class SettingsWidget(QWidget):
         
         tab_layout.addWidget(pdf_group)
         
-        tab_layout.addStretch()
-        
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "🎨 Branding")
+        # Connect branding fields
+        self.company_name_edit.textChanged.connect(self._on_text_setting_edited)
+        self.company_address_edit.textChanged.connect(self._on_text_setting_edited)
+        self.company_contact_edit.textChanged.connect(self._on_text_setting_edited)
+        self.user_name_edit.textChanged.connect(self._on_text_setting_edited)
+        self.user_id_edit.textChanged.connect(self._on_text_setting_edited)
         
         # Update logo preview
         self.update_logo_preview()
     
-    def _create_preferences_tab(self):
-        """Create user preferences configuration tab."""
-        tab = QScrollArea()
-        tab_widget = QWidget()
-        tab_layout = QVBoxLayout(tab_widget)
-        
+    def _populate_preferences_tab(self, tab_layout: QVBoxLayout):
+        """Populate the user preferences configuration tab."""
         # Report Settings Group
         report_group = QGroupBox("Report Settings")
         report_layout = QFormLayout(report_group)
@@ -404,9 +834,7 @@ class SettingsWidget(QWidget):
         audit_layout = QFormLayout(audit_group)
         
         # Data retention period
-        self.retention_days = QSpinBox()
-        self.retention_days.setRange(1, 3650)  # 1 day to 10 years
-        self.retention_days.setSuffix(" days")
+        self.retention_days = self._int_spinbox(1, 3650, " days")  # 1 day to 10 years
         audit_layout.addRow("Search History Retention:", self.retention_days)
         
         # Logging settings
@@ -429,14 +857,10 @@ class SettingsWidget(QWidget):
         gui_layout.addRow("Theme:", self.theme)
         
         # Window size settings
-        self.window_width = QSpinBox()
-        self.window_width.setRange(800, 3840)
-        self.window_width.setSuffix(" px")
+        self.window_width = self._int_spinbox(800, 3840, " px")
         gui_layout.addRow("Default Window Width:", self.window_width)
         
-        self.window_height = QSpinBox()
-        self.window_height.setRange(600, 2160)
-        self.window_height.setSuffix(" px")
+        self.window_height = self._int_spinbox(600, 2160, " px")
         gui_layout.addRow("Default Window Height:", self.window_height)
         
         # Auto-save searches
@@ -455,7 +879,7 @@ class SettingsWidget(QWidget):
             "Tags can be selected during searches and used for filtering search history."
         )
         tag_desc.setWordWrap(True)
-        tag_desc.setStyleSheet("color: #666; font-size: 11px; padding: 5px;")
+        tag_desc.setObjectName("tagDescription")
         tag_layout.addWidget(tag_desc)
         
         # Tag input and management
@@ -463,6 +887,13 @@ class SettingsWidget(QWidget):
         
         self.new_tag_input = QLineEdit()
         self.new_tag_input.setPlaceholderText("Enter new tag name (e.g., 'Project Alpha', 'Compliance Team')")
+        self.new_tag_input.setValidator(
+            QRegularExpressionValidator(
+                QRegularExpression(_TAG_NAME_PATTERN,
+                                   QRegularExpression.PatternOption.UseUnicodePropertiesOption),
+                self.new_tag_input
+            )
+        )
         tag_input_layout.addWidget(self.new_tag_input)
         
         self.add_tag_btn = QPushButton("Add Tag")
@@ -472,11 +903,16 @@ class SettingsWidget(QWidget):
         tag_layout.addLayout(tag_input_layout)
         
         # Tags list
-        self.tags_table = QTableWidget()
-        self.tags_table.setColumnCount(2)
-        self.tags_table.setHorizontalHeaderLabels(["Tag Name", "Actions"])
+        self.tags_model = TagTableModel(self)
+        self.tags_table = QTableView()
+        self.tags_table.setModel(self.tags_model)
         self.tags_table.setMaximumHeight(150)
         
+        # The Actions column paints a Remove button per row instead of hosting widgets
+        remove_delegate = ButtonDelegate(self.tags_table)
+        remove_delegate.clicked.connect(self._on_remove_tag_clicked)
+        self.tags_table.setItemDelegateForColumn(1, remove_delegate)
+        
         # Make table responsive
         header = self.tags_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
@@ -485,18 +921,9 @@ class SettingsWidget(QWidget):
         tag_layout.addWidget(self.tags_table)
         
         tab_layout.addWidget(tag_group)
-        
-        tab_layout.addStretch()
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "Preferences")
     
-    def _create_advanced_tab(self):
-        """Create advanced configuration tab."""
-        tab = QScrollArea()
-        tab_widget = QWidget()
-        tab_layout = QVBoxLayout(tab_widget)
-        
+    def _populate_advanced_tab(self, tab_layout: QVBoxLayout):
+        """Populate the advanced configuration tab."""
         # Database Settings Group
         db_group = QGroupBox("Database Configuration")
         db_layout = QFormLayout(db_group)
@@ -520,7 +947,7 @@ class SettingsWidget(QWidget):
         config_info_layout = QFormLayout()
         self.config_file_path = QLabel()
         self.config_file_path.setWordWrap(True)
-        self.config_file_path.setStyleSheet("font-family: monospace; background-color: #f0f0f0; padding: 5px;")
+        self.config_file_path.setObjectName("configFilePath")
         config_info_layout.addRow("Config File:", self.config_file_path)
         config_layout.addLayout(config_info_layout)
         
@@ -543,11 +970,11 @@ class SettingsWidget(QWidget):
         raw_config_layout = QVBoxLayout(raw_config_group)
         
         warning_label = QLabel("⚠️ Warning: Editing raw configuration can break the application. Use with caution.")
-        warning_label.setStyleSheet("color: orange; font-weight: bold;")
+        warning_label.setObjectName("rawConfigWarning")
         raw_config_layout.addWidget(warning_label)
         
         self.raw_config_editor = QTextEdit()
-        self.raw_config_editor.setFont(QFont("Courier", 10))
+        self.raw_config_editor.setFont(_monospace_font())
         self.raw_config_editor.setMaximumHeight(200)
         raw_config_layout.addWidget(self.raw_config_editor)
         
@@ -563,17 +990,9 @@ class SettingsWidget(QWidget):
         
         raw_config_layout.addLayout(raw_config_buttons)
         tab_layout.addWidget(raw_config_group)
-        
-        tab_layout.addStretch()
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "Advanced")
     
-    def _create_support_tab(self):
-        """Create support and about tab."""
-        tab = QScrollArea()
-        tab_widget = QWidget()
-        tab_layout = QVBoxLayout(tab_widget)
+    def _populate_support_tab(self, tab_layout: QVBoxLayout):
+        """Populate the support and about tab."""
         tab_layout.setSpacing(20)
         
         # Application info section
@@ -581,10 +1000,7 @@ class SettingsWidget(QWidget):
         app_layout = QVBoxLayout(app_group)
         
         app_title = QLabel("Sanctions Checker v1.0")
-        app_title_font = QFont()
-        app_title_font.setPointSize(14)
-        app_title_font.setBold(True)
-        app_title.setFont(app_title_font)
+        app_title.setFont(_bold_font(14))
         app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         app_layout.addWidget(app_title)
         
@@ -614,26 +1030,7 @@ class SettingsWidget(QWidget):
         # Coffee button
         coffee_button = QPushButton("☕ Buy Me a Coffee")
         coffee_button.clicked.connect(self._open_coffee_link)
-        coffee_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FFDD00;
-                border: 2px solid #FF813F;
-                border-radius: 12px;
-                padding: 12px 24px;
-                font-weight: bold;
-                font-size: 14px;
-                color: #000000;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #FF813F;
-                color: #FFFFFF;
-                transform: scale(1.05);
-            }
-            QPushButton:pressed {
-                background-color: #E6730F;
-            }
-        """)
+        coffee_button.setObjectName("coffeeButton")
         support_layout.addWidget(coffee_button)
         
         # Benefits of support
@@ -644,7 +1041,7 @@ class SettingsWidget(QWidget):
             "• Providing technical support\n"
             "• Keeping the application free and open"
         )
-        benefits_label.setStyleSheet("color: #666; font-style: italic;")
+        benefits_label.setObjectName("supportBenefits")
         support_layout.addWidget(benefits_label)
         
         tab_layout.addWidget(support_group)
@@ -659,11 +1056,6 @@ class SettingsWidget(QWidget):
         tech_layout.addRow("Report Format:", QLabel("PDF with cryptographic verification"))
         
         tab_layout.addWidget(tech_group)
-        
-        tab_layout.addStretch()
-        tab.setWidget(tab_widget)
-        tab.setWidgetResizable(True)
-        self.tabs.addTab(tab, "☕ Support")
     
     def _open_coffee_link(self):
         """Open the Buy Me a Coffee link in the default browser."""
@@ -679,17 +1071,20 @@ class SettingsWidget(QWidget):
         if not tag_name:
             return
         
-        # Get current tags
-        current_tags = self.config.get('search.tags', [])
+        if not _TAG_NAME_RE.match(tag_name):
+            QMessageBox.warning(self, "Invalid Tag",
+                                "Tag names may only contain letters, digits, spaces, '_', '-' and '.', "
+                                "up to 64 characters.")
+            return
         
         # Check if tag already exists
-        if tag_name in current_tags:
+        if tag_name in self._tags_cache:
             QMessageBox.information(self, "Tag Exists", f"Tag '{tag_name}' already exists.")
             return
         
         # Add new tag
-        current_tags.append(tag_name)
-        self.config.set('search.tags', current_tags)
+        self._tags_cache.append(tag_name)
+        self._cset('search.tags', list(self._tags_cache))
         
         # Clear input
         self.new_tag_input.clear()
@@ -709,26 +1104,19 @@ class SettingsWidget(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            current_tags = self.config.get('search.tags', [])
-            if tag_name in current_tags:
-                current_tags.remove(tag_name)
-                self.config.set('search.tags', current_tags)
+            if tag_name in self._tags_cache:
+                self._tags_cache.remove(tag_name)
+                self._cset('search.tags', list(self._tags_cache))
                 self.refresh_tags_table()
                 self._on_setting_changed()
     
     def refresh_tags_table(self):
         """Refresh the tags table display."""
-        tags = self.config.get('search.tags', [])
-        self.tags_table.setRowCount(len(tags))
-        
-        for row, tag in enumerate(tags):
-            # Tag name
-            self.tags_table.setItem(row, 0, QTableWidgetItem(tag))
-            
-            # Remove button
-            remove_btn = QPushButton("Remove")
-            remove_btn.clicked.connect(lambda checked, t=tag: self.remove_tag(t))
-            self.tags_table.setCellWidget(row, 1, remove_btn)
+        self.tags_model.set_tags(self._tags_cache)
+    
+    def _on_remove_tag_clicked(self, index: QModelIndex):
+        """Remove the tag in the row of the clicked Remove button."""
+        self.remove_tag(self.tags_model.tag(index.row()))
     
     def setup_connections(self):
         """Set up signal-slot connections."""
@@ -738,12 +1126,11 @@ class SettingsWidget(QWidget):
         self.defaults_button.clicked.connect(self.restore_defaults)
         
         # Threshold controls - sync sliders with spin boxes
-        self.levenshtein_threshold.valueChanged.connect(self._sync_levenshtein_slider)
-        self.levenshtein_slider.valueChanged.connect(self._sync_levenshtein_spinbox)
-        self.jaro_winkler_threshold.valueChanged.connect(self._sync_jaro_winkler_slider)
-        self.jaro_winkler_slider.valueChanged.connect(self._sync_jaro_winkler_spinbox)
+        self._connect_threshold_slider(self.levenshtein_slider, self.levenshtein_threshold)
+        self._connect_threshold_slider(self.jaro_winkler_slider, self.jaro_winkler_threshold)
         
         # Data source management
+        self.sources_model.dataChanged.connect(self._on_setting_changed)
         self.add_source_button.clicked.connect(self._add_data_source)
         self.edit_source_button.clicked.connect(self._edit_data_source)
         self.remove_source_button.clicked.connect(self._remove_data_source)
@@ -759,159 +1146,100 @@ class SettingsWidget(QWidget):
         self.validate_raw_config_button.clicked.connect(self._validate_raw_config)
         self.apply_raw_config_button.clicked.connect(self._apply_raw_config)
         
-        # Connect all input fields to change detection
+        # Connect all input fields to change detection (branding fields are connected
+        # when the Branding tab is built)
         self._connect_change_detection()
         
-        # Connect branding fields
-        self.company_name_edit.textChanged.connect(self._on_setting_changed)
-        self.company_address_edit.textChanged.connect(self._on_setting_changed)
-        self.company_contact_edit.textChanged.connect(self._on_setting_changed)
-        self.user_name_edit.textChanged.connect(self._on_setting_changed)
-        self.user_id_edit.textChanged.connect(self._on_setting_changed)
-        
         # Connect tag management
         self.new_tag_input.returnPressed.connect(self.add_tag)
     
     def _connect_change_detection(self):
         """Connect all input fields to change detection."""
-        # Matching tab
-        self.levenshtein_threshold.valueChanged.connect(self._on_setting_changed)
-        self.jaro_winkler_threshold.valueChanged.connect(self._on_setting_changed)
-        self.company_threshold.valueChanged.connect(self._on_setting_changed)
-        self.individual_threshold.valueChanged.connect(self._on_setting_changed)
-        self.soundex_enabled.toggled.connect(self._on_setting_changed)
-        
-        # Data sources tab
-        self.auto_update_enabled.toggled.connect(self._on_setting_changed)
-        self.update_interval.valueChanged.connect(self._on_setting_changed)
-        self.retry_attempts.valueChanged.connect(self._on_setting_changed)
-        self.retry_delay.valueChanged.connect(self._on_setting_changed)
-        
-        # Preferences tab
-        self.default_format.currentTextChanged.connect(self._on_setting_changed)
-        self.include_algorithm_details.toggled.connect(self._on_setting_changed)
-        self.include_verification_hash.toggled.connect(self._on_setting_changed)
-        self.retention_days.valueChanged.connect(self._on_setting_changed)
-        self.log_searches.toggled.connect(self._on_setting_changed)
-        self.log_level.currentTextChanged.connect(self._on_setting_changed)
-        self.theme.currentTextChanged.connect(self._on_setting_changed)
-        self.window_width.valueChanged.connect(self._on_setting_changed)
-        self.window_height.valueChanged.connect(self._on_setting_changed)
-        self.auto_save_searches.toggled.connect(self._on_setting_changed)
-        
-        # Advanced tab
-        self.database_url.textChanged.connect(self._on_setting_changed)
-        self.database_echo.toggled.connect(self._on_setting_changed)
+        for _key, attr, kind, _default in _SETTINGS_SPEC:
+            slot = self._on_text_setting_edited if kind is _TEXT_FIELD else self._on_setting_changed
+            getattr(getattr(self, attr), kind[0]).connect(slot)
     
     def load_current_settings(self):
         """Load current settings from configuration."""
+        # The config may have been changed outside this widget since the last load
+        self._cfg_cache.clear()
         try:
             # Store original values for reset functionality
-            self.original_config = {
-                'matching.levenshtein_threshold': self.config.get('matching.levenshtein_threshold'),
-                'matching.jaro_winkler_threshold': self.config.get('matching.jaro_winkler_threshold'),
-                'matching.company_threshold': self.config.get('matching.company_threshold'),
-                'matching.individual_threshold': self.config.get('matching.individual_threshold'),
-                'matching.soundex_enabled': self.config.get('matching.soundex_enabled'),
-                'updates.auto_update': self.config.get('updates.auto_update'),
-                'updates.update_interval_hours': self.config.get('updates.update_interval_hours'),
-                'updates.retry_attempts': self.config.get('updates.retry_attempts'),
-                'updates.retry_delay_seconds': self.config.get('updates.retry_delay_seconds'),
-                'reports.default_format': self.config.get('reports.default_format'),
-                'reports.include_algorithm_details': self.config.get('reports.include_algorithm_details'),
-                'reports.include_verification_hash': self.config.get('reports.include_verification_hash'),
-                'audit.retention_days': self.config.get('audit.retention_days'),
-                'audit.log_searches': self.config.get('audit.log_searches'),
-                'audit.log_level': self.config.get('audit.log_level'),
-                'gui.theme': self.config.get('gui.theme'),
-                'gui.window_width': self.config.get('gui.window_width'),
-                'gui.window_height': self.config.get('gui.window_height'),
-                'gui.auto_save_searches': self.config.get('gui.auto_save_searches'),
-                'database.url': self.config.get('database.url'),
-                'database.echo': self.config.get('database.echo'),
-            }
-            
-            # Load matching settings
-            self.levenshtein_threshold.setValue(self.config.get('matching.levenshtein_threshold', 0.8))
-            self.jaro_winkler_threshold.setValue(self.config.get('matching.jaro_winkler_threshold', 0.85))
-            self.company_threshold.setValue(self.config.get('matching.company_threshold', 0.75))
-            self.individual_threshold.setValue(self.config.get('matching.individual_threshold', 0.8))
-            self.soundex_enabled.setChecked(self.config.get('matching.soundex_enabled', True))
-            
-            # Load data source settings
-            self._load_data_sources()
-            self.auto_update_enabled.setChecked(self.config.get('updates.auto_update', True))
-            self.update_interval.setValue(self.config.get('updates.update_interval_hours', 24))
-            self.retry_attempts.setValue(self.config.get('updates.retry_attempts', 3))
-            self.retry_delay.setValue(self.config.get('updates.retry_delay_seconds', 300))
-            
-            # Load preferences
-            default_format = self.config.get('reports.default_format', 'pdf').upper()
-            index = self.default_format.findText(default_format)
-            if index >= 0:
-                self.default_format.setCurrentIndex(index)
-            
-            self.include_algorithm_details.setChecked(self.config.get('reports.include_algorithm_details', True))
-            self.include_verification_hash.setChecked(self.config.get('reports.include_verification_hash', True))
-            self.retention_days.setValue(self.config.get('audit.retention_days', 365))
-            self.log_searches.setChecked(self.config.get('audit.log_searches', True))
+            self.original_config = {key: self._cget(key, _SETTING_DEFAULTS[key]) for key in _ORIGINAL_KEYS}
             
-            log_level = self.config.get('audit.log_level', 'INFO')
-            index = self.log_level.findText(log_level)
-            if index >= 0:
-                self.log_level.setCurrentIndex(index)
+            # Load search tags
+            self._tags_cache = list(self._cget('search.tags', []))
+            self.refresh_tags_table()
             
-            theme = self.config.get('gui.theme', 'default').title()
-            index = self.theme.findText(theme)
-            if index >= 0:
-                self.theme.setCurrentIndex(index)
+            self.config_file_path.setText(str(self.config.config_file))
+            self._apply_values(self.original_config)
             
-            self.window_width.setValue(self.config.get('gui.window_width', 1200))
-            self.window_height.setValue(self.config.get('gui.window_height', 800))
-            self.auto_save_searches.setChecked(self.config.get('gui.auto_save_searches', True))
+        except Exception as e:
+            logger.error(f"Error loading settings: {e}")
+            self._show_error("Settings Load Error", f"Failed to load settings: {str(e)}")
+    
+    def _apply_values(self, values: Dict[str, Any]):
+        """
+        Show setting values in the fields and the data sources table from the config.
+        
+        Args:
+            values: Setting values by config key; None values show the default
+        """
+        # Loading is not an edit: keep the fields from signalling changes while filled
+        blockers = [QSignalBlocker(field) for field in self._setting_fields()]
+        self._loading = True
+        try:
+            # Load the single-field settings
+            for key, attr, (_signal, _read, show), default in _SETTINGS_SPEC:
+                value = values[key]
+                show(getattr(self, attr), default if value is None else value)
             
-            # Load advanced settings
-            self.database_url.setText(self.config.get('database.url', ''))
-            self.database_echo.setChecked(self.config.get('database.echo', False))
-            self.config_file_path.setText(str(self.config.config_file))
+            # Load data source settings
+            self._load_data_sources()
             
             # Sync sliders with spinboxes
-            self._sync_levenshtein_slider()
-            self._sync_jaro_winkler_slider()
+            self._set_slider_value(self.levenshtein_slider, self.levenshtein_threshold.value())
+            self._set_slider_value(self.jaro_winkler_slider, self.jaro_winkler_threshold.value())
             
-            # Reset change tracking
+            # Reset change tracking and validate the loaded values once
+            self._dirty_timer.stop()
+            self._typing_timer.stop()
+            self.validation_timer.stop()
             self.has_unsaved_changes = False
             self.save_button.setEnabled(False)
-            
-        except Exception as e:
-            logger.error(f"Error loading settings: {e}")
-            self._show_error("Settings Load Error", f"Failed to load settings: {str(e)}")
+            self._validate_all_settings()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self._loading = False
+    
+    def _setting_fields(self):
+        """Get the input fields filled by load_current_settings."""
+        return tuple(getattr(self, attr) for _key, attr, _kind, _default in _SETTINGS_SPEC)
+    
+    def _cget(self, key: str, default=None):
+        """Get a config value, reading each key from the config only once."""
+        value = self._cfg_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._cfg_cache[key] = self.config.get(key, _MISSING)
+        return default if value is _MISSING else value
+    
+    def _cset(self, key: str, value):
+        """Set a config value and drop its cached copy."""
+        self.config.set(key, value)
+        self._cfg_cache.pop(key, None)
+    
+    def _cset_many(self, values: Dict[str, Any]):
+        """Set several config values, collected up front, and drop the cached reads once."""
+        for key, value in values.items():
+            self.config.set(key, value)
+        self._cfg_cache.clear()
     
     def _load_data_sources(self):
         """Load data sources into the table."""
         try:
-            data_sources = self.config.get('data_sources', {})
-            self.sources_table.setRowCount(len(data_sources))
-            
-            for row, (source_name, source_config) in enumerate(data_sources.items()):
-                # Source name
-                name_item = QTableWidgetItem(source_name)
-                name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.sources_table.setItem(row, 0, name_item)
-                
-                # URL
-                url_item = QTableWidgetItem(source_config.get('url', ''))
-                self.sources_table.setItem(row, 1, url_item)
-                
-                # Format
-                format_item = QTableWidgetItem(source_config.get('format', ''))
-                self.sources_table.setItem(row, 2, format_item)
-                
-                # Enabled checkbox
-                enabled_checkbox = QCheckBox()
-                enabled_checkbox.setChecked(source_config.get('enabled', True))
-                enabled_checkbox.toggled.connect(self._on_setting_changed)
-                self.sources_table.setCellWidget(row, 3, enabled_checkbox)
+            data_sources = self._cget('data_sources', {})
+            self.sources_model.set_sources(data_sources)
             
         except Exception as e:
             logger.error(f"Error loading data sources: {e}")
@@ -919,6 +1247,20 @@ class SettingsWidget(QWidget):
     @pyqtSlot()
     def _on_setting_changed(self):
         """Handle setting change."""
+        if self._loading:
+            # Changes made by load_current_settings itself, e.g. via the sources model
+            return
+        self._cfg_cache.clear()
+        self._dirty_timer.start()
+    
+    @pyqtSlot()
+    def _on_text_setting_edited(self):
+        """Handle a keystroke in a setting line edit; reported as a change once typing pauses."""
+        if not self._loading:
+            self._typing_timer.start()
+    
+    def _mark_settings_dirty(self):
+        """Mark the settings as changed once a burst of field changes has settled."""
         self.has_unsaved_changes = True
         self.save_button.setEnabled(True)
         self.status_label.setVisible(False)
@@ -927,34 +1269,20 @@ class SettingsWidget(QWidget):
         self.validation_timer.stop()
         self.validation_timer.start(500)
     
-    def _sync_levenshtein_slider(self):
-        """Sync Levenshtein slider with spinbox."""
-        value = int(self.levenshtein_threshold.value() * 100)
-        self.levenshtein_slider.blockSignals(True)
-        self.levenshtein_slider.setValue(value)
-        self.levenshtein_slider.blockSignals(False)
-    
-    def _sync_levenshtein_spinbox(self):
-        """Sync Levenshtein spinbox with slider."""
-        value = self.levenshtein_slider.value() / 100.0
-        self.levenshtein_threshold.blockSignals(True)
-        self.levenshtein_threshold.setValue(value)
-        self.levenshtein_threshold.blockSignals(False)
-        self._on_setting_changed()
+    def _connect_threshold_slider(self, slider: QSlider, spinbox: QDoubleSpinBox):
+        """Keep a 0-100 slider and its threshold spin box in step without echoing changes back."""
+        spinbox.valueChanged.connect(lambda value: self._set_slider_value(slider, value))
+        slider.valueChanged.connect(lambda position: self._set_spinbox_value(spinbox, position))
     
-    def _sync_jaro_winkler_slider(self):
-        """Sync Jaro-Winkler slider with spinbox."""
-        value = int(self.jaro_winkler_threshold.value() * 100)
-        self.jaro_winkler_slider.blockSignals(True)
-        self.jaro_winkler_slider.setValue(value)
-        self.jaro_winkler_slider.blockSignals(False)
-    
-    def _sync_jaro_winkler_spinbox(self):
-        """Sync Jaro-Winkler spinbox with slider."""
-        value = self.jaro_winkler_slider.value() / 100.0
-        self.jaro_winkler_threshold.blockSignals(True)
-        self.jaro_winkler_threshold.setValue(value)
-        self.jaro_winkler_threshold.blockSignals(False)
+    def _set_slider_value(self, slider: QSlider, threshold: float):
+        """Move a slider to a threshold value without it signalling back."""
+        with QSignalBlocker(slider):
+            slider.setValue(int(threshold * 100))
+    
+    def _set_spinbox_value(self, spinbox: QDoubleSpinBox, position: int):
+        """Set a threshold spin box from a slider position and mark the settings changed."""
+        with QSignalBlocker(spinbox):
+            spinbox.setValue(position / 100.0)
         self._on_setting_changed()
     
     def _validate_all_settings(self):
@@ -963,16 +1291,16 @@ class SettingsWidget(QWidget):
         
         try:
             # Validate thresholds
-            if self.levenshtein_threshold.value() < 0.0 or self.levenshtein_threshold.value() > 1.0:
+            if not 0.0 <= self.levenshtein_threshold.value() <= 1.0:
                 errors.append("Levenshtein threshold must be between 0.0 and 1.0")
             
-            if self.jaro_winkler_threshold.value() < 0.0 or self.jaro_winkler_threshold.value() > 1.0:
+            if not 0.0 <= self.jaro_winkler_threshold.value() <= 1.0:
                 errors.append("Jaro-Winkler threshold must be between 0.0 and 1.0")
             
-            if self.company_threshold.value() < 0.0 or self.company_threshold.value() > 1.0:
+            if not 0.0 <= self.company_threshold.value() <= 1.0:
                 errors.append("Company threshold must be between 0.0 and 1.0")
             
-            if self.individual_threshold.value() < 0.0 or self.individual_threshold.value() > 1.0:
+            if not 0.0 <= self.individual_threshold.value() <= 1.0:
                 errors.append("Individual threshold must be between 0.0 and 1.0")
             
             # Validate update settings
@@ -998,7 +1326,7 @@ class SettingsWidget(QWidget):
             
             # Validate database URL
             db_url = self.database_url.text().strip()
-            if db_url and not (db_url.startswith('sqlite://') or db_url.startswith('postgresql://') or db_url.startswith('mysql://')):
+            if db_url and not db_url.startswith(_DB_URL_SCHEMES):
                 errors.append("Database URL must start with sqlite://, postgresql://, or mysql://")
             
             # Display validation results
@@ -1025,35 +1353,13 @@ class SettingsWidget(QWidget):
             if self.error_label.isVisible():
                 return
             
-            # Save matching settings
-            self.config.set('matching.levenshtein_threshold', self.levenshtein_threshold.value())
-            self.config.set('matching.jaro_winkler_threshold', self.jaro_winkler_threshold.value())
-            self.config.set('matching.company_threshold', self.company_threshold.value())
-            self.config.set('matching.individual_threshold', self.individual_threshold.value())
-            self.config.set('matching.soundex_enabled', self.soundex_enabled.isChecked())
-            
-            # Save data source settings
-            self._save_data_sources()
-            self.config.set('updates.auto_update', self.auto_update_enabled.isChecked())
-            self.config.set('updates.update_interval_hours', self.update_interval.value())
-            self.config.set('updates.retry_attempts', self.retry_attempts.value())
-            self.config.set('updates.retry_delay_seconds', self.retry_delay.value())
-            
-            # Save preferences
-            self.config.set('reports.default_format', self.default_format.currentText().lower())
-            self.config.set('reports.include_algorithm_details', self.include_algorithm_details.isChecked())
-            self.config.set('reports.include_verification_hash', self.include_verification_hash.isChecked())
-            self.config.set('audit.retention_days', self.retention_days.value())
-            self.config.set('audit.log_searches', self.log_searches.isChecked())
-            self.config.set('audit.log_level', self.log_level.currentText())
-            self.config.set('gui.theme', self.theme.currentText().lower())
-            self.config.set('gui.window_width', self.window_width.value())
-            self.config.set('gui.window_height', self.window_height.value())
-            self.config.set('gui.auto_save_searches', self.auto_save_searches.isChecked())
-            
-            # Save advanced settings
-            self.config.set('database.url', self.database_url.text().strip())
-            self.config.set('database.echo', self.database_echo.isChecked())
+            pending = {
+                key: read(getattr(self, attr))
+                for key, attr, (_signal, read, _show), _default in _SETTINGS_SPEC
+            }
+            pending['data_sources'] = self.sources_model.to_config()
+            self._cset_many(pending)
+            self.original_config = {key: pending[key] for key in _ORIGINAL_KEYS}
             
             # Persist to file
             self.config.save()
@@ -1074,40 +1380,11 @@ class SettingsWidget(QWidget):
             logger.error(f"Error saving settings: {e}")
             self._show_error("Save Error", f"Failed to save settings: {str(e)}")
     
-    def _save_data_sources(self):
-        """Save data sources from table to configuration."""
-        try:
-            data_sources = {}
-            
-            for row in range(self.sources_table.rowCount()):
-                name_item = self.sources_table.item(row, 0)
-                url_item = self.sources_table.item(row, 1)
-                format_item = self.sources_table.item(row, 2)
-                enabled_widget = self.sources_table.cellWidget(row, 3)
-                
-                if name_item and url_item and format_item and enabled_widget:
-                    source_name = name_item.text()
-                    data_sources[source_name] = {
-                        'url': url_item.text(),
-                        'format': format_item.text(),
-                        'enabled': enabled_widget.isChecked()
-                    }
-            
-            self.config.set('data_sources', data_sources)
-            
-        except Exception as e:
-            logger.error(f"Error saving data sources: {e}")
-            raise
-    
     def reset_settings(self):
         """Reset settings to previously saved values."""
         try:
-            # Reload from original config
-            for key, value in self.original_config.items():
-                self.config.set(key, value)
-            
-            # Reload UI
-            self.load_current_settings()
+            # The config still holds the saved values, so only the fields need restoring
+            self._apply_values(self.original_config)
             
             self.status_label.setText("Settings reset to last saved values!")
             self.status_label.setVisible(True)
@@ -1150,19 +1427,19 @@ class SettingsWidget(QWidget):
     def _add_data_source(self):
         """Add a new data source."""
         # This would open a dialog to add a new data source
-        QMessageBox.information(self, "Add Data Source", "Data source management dialog will be implemented.")
+        self._show_info("Add Data Source", "Data source management dialog will be implemented.")
     
     def _edit_data_source(self):
         """Edit selected data source."""
-        current_row = self.sources_table.currentRow()
+        current_row = self.sources_table.currentIndex().row()
         if current_row >= 0:
-            QMessageBox.information(self, "Edit Data Source", f"Edit data source at row {current_row + 1}")
+            self._show_info("Edit Data Source", f"Edit data source at row {current_row + 1}")
         else:
-            QMessageBox.information(self, "Edit Data Source", "Please select a data source to edit.")
+            self._show_info("Edit Data Source", "Please select a data source to edit.")
     
     def _remove_data_source(self):
         """Remove selected data source."""
-        current_row = self.sources_table.currentRow()
+        current_row = self.sources_table.currentIndex().row()
         if current_row >= 0:
             reply = QMessageBox.question(
                 self,
@@ -1171,21 +1448,20 @@ class SettingsWidget(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.sources_table.removeRow(current_row)
+                self.sources_model.remove_source(current_row)
                 self._on_setting_changed()
         else:
-            QMessageBox.information(self, "Remove Data Source", "Please select a data source to remove.")
+            self._show_info("Remove Data Source", "Please select a data source to remove.")
     
     def _test_data_source(self):
         """Test connection to selected data source."""
-        current_row = self.sources_table.currentRow()
+        current_row = self.sources_table.currentIndex().row()
         if current_row >= 0:
-            url_item = self.sources_table.item(current_row, 1)
-            if url_item:
-                url = url_item.text()
-                QMessageBox.information(self, "Test Connection", f"Testing connection to: {url}\n(Test functionality will be implemented)")
+            url = self.sources_model.source_url(current_row)
+            if url:
+                self._show_info("Test Connection", f"Testing connection to: {url}\n(Test functionality will be implemented)")
         else:
-            QMessageBox.information(self, "Test Connection", "Please select a data source to test.")
+            self._show_info("Test Connection", "Please select a data source to test.")
     
     def _export_config(self):
         """Export configuration to file."""
@@ -1198,9 +1474,7 @@ class SettingsWidget(QWidget):
             )
             
             if filename:
-                import json
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(self.config._config_data, f, indent=2, ensure_ascii=False)
+                _write_config_json(self.config._config_data, filename)
                 
                 QMessageBox.information(self, "Export Successful", f"Configuration exported to:\n{filename}")
                 
@@ -1218,9 +1492,7 @@ class SettingsWidget(QWidget):
             )
             
             if filename:
-                import json
-                with open(filename, 'r', encoding='utf-8') as f:
-                    imported_config = json.load(f)
+                imported_config = _read_config_json(filename)
                 
                 # Merge with current config
                 self.config._config_data = self.config._merge_config(self.config._defaults, imported_config)
@@ -1236,18 +1508,7 @@ class SettingsWidget(QWidget):
     def _open_config_folder(self):
         """Open configuration folder in file explorer."""
         try:
-            import os
-            import subprocess
-            import platform
-            
-            config_dir = str(self.config.config_dir)
-            
-            if platform.system() == "Windows":
-                os.startfile(config_dir)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", config_dir])
-            else:  # Linux
-                subprocess.run(["xdg-open", config_dir])
+            _open_in_file_manager(str(self.config.config_dir))
                 
         except Exception as e:
             self._show_error("Open Folder Error", f"Failed to open configuration folder: {str(e)}")
@@ -1255,8 +1516,9 @@ class SettingsWidget(QWidget):
     def _load_raw_config(self):
         """Load current configuration into raw editor."""
         try:
-            import json
-            config_json = json.dumps(self.config._config_data, indent=2, ensure_ascii=False)
+            config_json = _dump_config_json(self.config._config_data)
+            # setPlainText clears the modified flag, so drop the validated result first
+            self._raw_cache = None
             self.raw_config_editor.setPlainText(config_json)
         except Exception as e:
             self._show_error("Load Error", f"Failed to load raw configuration: {str(e)}")
@@ -1264,9 +1526,12 @@ class SettingsWidget(QWidget):
     def _validate_raw_config(self):
         """Validate JSON in raw config editor."""
         try:
-            import json
             config_text = self.raw_config_editor.toPlainText()
-            json.loads(config_text)  # This will raise an exception if invalid
+            self._raw_cache = None
+            parsed = _parse_config_json(config_text)  # This will raise an exception if invalid
+            self._raw_cache = parsed
+            # Edits set the flag again; undoing back to this text clears it
+            self.raw_config_editor.document().setModified(False)
             QMessageBox.information(self, "Validation", "JSON configuration is valid!")
         except json.JSONDecodeError as e:
             self._show_error("Validation Error", f"Invalid JSON: {str(e)}")
@@ -1276,9 +1541,7 @@ class SettingsWidget(QWidget):
     def _apply_raw_config(self):
         """Apply raw configuration changes."""
         try:
-            import json
-            config_text = self.raw_config_editor.toPlainText()
-            new_config = json.loads(config_text)
+            new_config = self._parse_raw_config()
             
             # Merge with defaults to ensure all required keys exist
             self.config._config_data = self.config._merge_config(self.config._defaults, new_config)
@@ -1293,36 +1556,94 @@ class SettingsWidget(QWidget):
         except Exception as e:
             self._show_error("Apply Error", f"Failed to apply configuration: {str(e)}")
     
+    def _parse_raw_config(self) -> Dict[str, Any]:
+        """Parse the raw config editor text, reusing the result of Validate if the text is unchanged."""
+        cached, self._raw_cache = self._raw_cache, None
+        # The cached dict is handed over rather than kept, since the config may take ownership of it
+        if cached is not None and not self.raw_config_editor.document().isModified():
+            return cached
+        return _parse_config_json(self.raw_config_editor.toPlainText())
+    
+    def _show_info(self, title: str, message: str):
+        """Show an information message in a message box reused across calls."""
+        if self._info_box is None:
+            self._info_box = QMessageBox(self)
+            self._info_box.setIcon(QMessageBox.Icon.Information)
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(message)
+        self._info_box.exec()
+    
     def _show_error(self, title: str, message: str):
         """Show error message dialog."""
         QMessageBox.critical(self, title, message)
     
     def update_logo_preview(self):
         """Update the logo preview in the branding tab."""
+        self._logo_load_generation += 1
         try:
-            # Get current logo
-            logo_pixmap = resource_manager.get_logo_pixmap(width=200)
-            if not logo_pixmap.isNull():
-                self.logo_preview_label.setPixmap(logo_pixmap)
-                
-                if resource_manager.has_logo():
-                    self.logo_status_label.setText("✅ Custom logo installed\nLogo will appear in application interface and PDF reports.")
-                    self.logo_status_label.setStyleSheet("color: green;")
-                else:
-                    self.logo_status_label.setText("📝 Using default placeholder\nUpload your company logo for professional branding.")
-                    self.logo_status_label.setStyleSheet("color: orange;")
+            # Use the cached pixmap if there is one; only a custom logo needs file I/O
+            logo_pixmap = resource_manager.find_cached_logo_pixmap(width=200)
+            if logo_pixmap is None and not resource_manager.has_logo():
+                logo_pixmap = resource_manager.get_logo_pixmap(width=200)
+            if logo_pixmap is not None:
+                self._show_logo_preview(logo_pixmap)
+                return
+            
+            # Decode and scale the logo in the background
+            self.logo_preview_label.setText("Loading logo...")
+            dpr = resource_manager.device_pixel_ratio()
+            task = LogoLoadTask(self._logo_load_generation, 200, dpr)
+            task.signals.loaded.connect(self._on_logo_image_loaded)
+            QThreadPool.globalInstance().start(task)
+        except Exception as e:
+            self._show_logo_error(e)
+    
+    def _on_logo_image_loaded(self, generation: int, stamp, image: Optional[QImage]):
+        """Show a logo loaded by LogoLoadTask, unless a newer preview was requested."""
+        if generation != self._logo_load_generation:
+            return
+        try:
+            if image is None:
+                logo_pixmap = resource_manager.get_logo_pixmap(width=200)
             else:
-                self.logo_preview_label.setText("❌ No logo available")
-                self.logo_status_label.setText("No logo found. Please upload a logo.")
-                self.logo_status_label.setStyleSheet("color: red;")
+                logo_pixmap = resource_manager.cache_logo_pixmap(stamp, image, width=200,
+                                                                 dpr=image.devicePixelRatio())
+            self._show_logo_preview(logo_pixmap)
         except Exception as e:
-            self.logo_preview_label.setText("❌ Error loading logo")
-            self.logo_status_label.setText(f"Error: {str(e)}")
-            self.logo_status_label.setStyleSheet("color: red;")
+            self._show_logo_error(e)
+    
+    def _show_logo_preview(self, logo_pixmap):
+        """Show a logo pixmap and the matching status in the branding tab."""
+        if not logo_pixmap.isNull():
+            self.logo_preview_label.setPixmap(logo_pixmap)
+            
+            if resource_manager.has_logo():
+                self._set_logo_status("✅ Custom logo installed\nLogo will appear in application interface and PDF reports.", "ok")
+            else:
+                self._set_logo_status("📝 Using default placeholder\nUpload your company logo for professional branding.", "placeholder")
+        else:
+            self.logo_preview_label.setText("❌ No logo available")
+            self._set_logo_status("No logo found. Please upload a logo.", "error")
+    
+    def _show_logo_error(self, error: Exception):
+        """Show a logo loading error in the branding tab."""
+        self.logo_preview_label.setText("❌ Error loading logo")
+        self._set_logo_status(f"Error: {error}", "error")
+    
+    def _set_logo_status(self, text: str, state: str):
+        """Show a logo status message styled by its state (ok, placeholder or error)."""
+        self.logo_status_label.setText(text)
+        if self.logo_status_label.property("state") != state:
+            self.logo_status_label.setProperty("state", state)
+            # Dynamic property selectors only apply after the label is re-polished
+            style = self.logo_status_label.style()
+            style.unpolish(self.logo_status_label)
+            style.polish(self.logo_status_label)
     
     def upload_logo(self):
         """Open logo upload dialog."""
         try:
+            from .logo_upload_dialog import LogoUploadDialog
             dialog = LogoUploadDialog(self)
             dialog.logo_updated.connect(self.on_logo_updated)
             dialog.exec()
@@ -1382,7 +1703,7 @@ class SettingsWidget(QWidget):
     
     def closeEvent(self, event):
         """Handle widget close event."""
-        if self.has_unsaved_changes:
+        if self.has_unsaved_changes or self._dirty_timer.isActive() or self._typing_timer.isActive():
             reply = QMessageBox.question(
                 self,
                 "Unsaved Changes",
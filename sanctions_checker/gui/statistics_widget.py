@@ -7,37 +7,117 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                             QTableWidgetItem, QLabel, QGroupBox, QHeaderView,
                             QTabWidget, QPushButton, QTextEdit, QSplitter,
                             QTreeWidget, QTreeWidgetItem, QProgressBar)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QColor
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 
 from ..services.data_status_service import DataStatusService, DataStatistics
 
 
-class StatisticsCalculationWorker(QThread):
-    """Worker thread for calculating statistics."""
+def _table_rows(data: Dict[str, int]) -> List[Tuple[str, int, float]]:
+    """Get (key, count, percentage) table rows for a count mapping, largest count first."""
+    sorted_data = sorted(data.items(), key=lambda x: x[1], reverse=True)
+    total = sum(data.values())
+    return [(key, count, (count / total * 100) if total > 0 else 0)
+            for key, count in sorted_data]
+
+
+def _combine_statistics(statistics: Dict[str, DataStatistics]):
+    """
+    Combine the statistics of all sources.
+    
+    Pure computation, so it can run on the calculation thread.
+    
+    Returns:
+        Tuple of entity type, country and timeline table rows, and the raw data JSON
+    """
+    # Counter.update sums the per-source counts in C
+    combined_countries = Counter()
+    combined_entity_types = Counter()
+    combined_date_ranges = Counter()
+    
+    for stat in statistics.values():
+        combined_countries.update(stat.countries)
+        combined_entity_types.update(stat.entity_types)
+        combined_date_ranges.update(stat.date_ranges)
+    
+    raw_data = {
+        "source": "All Sources Combined",
+        "entity_types": dict(combined_entity_types),
+        "countries": dict(combined_countries),
+        "timeline": dict(combined_date_ranges),
+        "generated_at": datetime.now().isoformat()
+    }
+    
+    return (_table_rows(combined_entity_types), _table_rows(combined_countries),
+            _table_rows(combined_date_ranges), json.dumps(raw_data, indent=2))
+
+
+class StatisticsCalculationSignals(QObject):
+    """Signals emitted by StatisticsCalculationTask."""
     
     progress = pyqtSignal(str)  # progress message
-    statistics_ready = pyqtSignal(dict)  # statistics dict
+    statistics_ready = pyqtSignal(dict, object)  # statistics dict, combined details (or None)
     finished = pyqtSignal()
+
+
+class StatisticsCalculationTask(QRunnable):
+    """Runnable that calculates statistics on the shared thread pool."""
     
     def __init__(self, data_service: DataStatusService):
         super().__init__()
         self.data_service = data_service
+        self.signals = StatisticsCalculationSignals()
+        self._is_cancelled = False
     
     def run(self):
         """Calculate statistics for all data sources."""
         try:
-            self.progress.emit("Calculating statistics...")
+            self.signals.progress.emit("Calculating statistics...")
             statistics = self.data_service.get_all_statistics()
-            self.statistics_ready.emit(statistics)
+            combined = _combine_statistics(statistics) if statistics else None
+            if not self._is_cancelled:
+                self.signals.statistics_ready.emit(statistics, combined)
         except Exception as e:
             print(f"Error calculating statistics: {e}")
-            self.statistics_ready.emit({})
+            if not self._is_cancelled:
+                self.signals.statistics_ready.emit({}, None)
         finally:
-            self.finished.emit()
+            self.signals.finished.emit()
+    
+    def cancel(self):
+        """Discard the result of the calculation."""
+        self._is_cancelled = True
+
+
+class StatisticsExportSignals(QObject):
+    """Signals emitted by StatisticsExportTask."""
+    
+    finished = pyqtSignal(str)  # filename
+    failed = pyqtSignal(str)  # error message
+
+
+class StatisticsExportTask(QRunnable):
+    """Runnable that writes exported statistics to a JSON file off the UI thread."""
+    
+    def __init__(self, export_data: dict, filename: str):
+        super().__init__()
+        self.export_data = export_data
+        self.filename = filename
+        self.signals = StatisticsExportSignals()
+    
+    def run(self):
+        """Serialize the export data straight into a buffered file."""
+        try:
+            with open(self.filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(self.export_data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filename)
 
 
 class StatisticsWidget(QWidget):
@@ -50,9 +130,18 @@ class StatisticsWidget(QWidget):
         self.statistics = {}
         self.calculation_worker = None
         
+        # Bumped whenever self.statistics is replaced; keys the combined-details cache
+        self._stats_version = 0
+        # (stats version, combined entity type, country and timeline rows, raw data JSON)
+        self._combined_cache = None
+        # Source list items by source id, updated in place on refresh
+        self._source_items = {}
+        self._export_task = None
+        # Set when a refresh is due but the widget is hidden; it runs on the next show
+        self._refresh_pending = True
+        
         self.init_ui()
         self.setup_timer()
-        self.refresh_statistics()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -193,13 +282,30 @@ class StatisticsWidget(QWidget):
     
     def setup_timer(self):
         """Setup automatic refresh timer."""
+        # Refresh requests arriving within 500ms of each other run one calculation
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setInterval(500)
+        self._refresh_debounce.timeout.connect(self._do_refresh)
+        
+        # Downloads trigger a refresh through refresh_statistics; this timer is only a
+        # safety net for data changed elsewhere
         self.timer = QTimer()
         self.timer.timeout.connect(self.refresh_statistics)
-        self.timer.start(600000)  # Refresh every 10 minutes
+        self.timer.start(3600000)  # Refresh every hour
     
     def refresh_statistics(self):
-        """Refresh statistics data."""
-        if self.calculation_worker and self.calculation_worker.isRunning():
+        """Request a statistics refresh; rapid requests are coalesced into one."""
+        self._refresh_debounce.start()
+    
+    def _do_refresh(self):
+        """Start calculating statistics, or mark the refresh pending if that cannot happen now."""
+        if not self.isVisible():
+            self._refresh_pending = True
+            return
+        if self.calculation_worker is not None:
+            # The running calculation may predate the change; refresh again once it is done
+            self._refresh_pending = True
             return
         
         # Disable refresh button and show progress
@@ -208,25 +314,33 @@ class StatisticsWidget(QWidget):
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.status_label.setText("Calculating statistics...")
         
-        # Start calculation worker
-        self.calculation_worker = StatisticsCalculationWorker(self.data_service)
-        self.calculation_worker.progress.connect(self.status_label.setText)
-        self.calculation_worker.statistics_ready.connect(self.on_statistics_ready)
-        self.calculation_worker.finished.connect(self.on_calculation_finished)
-        self.calculation_worker.start()
+        # Start calculation on the shared thread pool
+        self.calculation_worker = StatisticsCalculationTask(self.data_service)
+        signals = self.calculation_worker.signals
+        signals.progress.connect(self.status_label.setText)
+        signals.statistics_ready.connect(self.on_statistics_ready)
+        signals.finished.connect(self.on_calculation_finished)
+        QThreadPool.globalInstance().start(self.calculation_worker)
     
-    def on_statistics_ready(self, statistics: Dict[str, DataStatistics]):
-        """Handle new statistics data."""
+    def on_statistics_ready(self, statistics: Dict[str, DataStatistics], combined=None):
+        """Handle new statistics data, with the combined details if already computed."""
         self.statistics = statistics
+        self._stats_version += 1
+        self._combined_cache = (self._stats_version,) + combined if combined else None
         self.update_overview()
         self.update_source_list()
         self.update_details("ALL")  # Show combined statistics initially
     
     def on_calculation_finished(self):
         """Handle calculation completion."""
+        self.calculation_worker = None
         self.refresh_btn.setEnabled(True)
         self.progress_bar.setVisible(False)
         self.status_label.setText(f"Statistics updated at {datetime.now().strftime('%H:%M:%S')}")
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_statistics()
     
     def update_overview(self):
         """Update the overview section."""
@@ -256,23 +370,27 @@ class StatisticsWidget(QWidget):
     
     def update_source_list(self):
         """Update the source list."""
-        # Clear existing items (except "All Sources")
-        root = self.source_list.invisibleRootItem()
-        while root.childCount() > 1:
-            root.removeChild(root.child(1))
+        # Remove items of sources that are gone; the rest are updated in place so
+        # the selection survives a refresh
+        for source_id in [s for s in self._source_items if s not in self.statistics]:
+            item = self._source_items.pop(source_id)
+            self.source_list.takeTopLevelItem(self.source_list.indexOfTopLevelItem(item))
         
-        # Add source items
         for source_id, stat in self.statistics.items():
-            item = QTreeWidgetItem([f"{source_id} ({stat.total_entities:,} entities)"])
-            item.setData(0, Qt.ItemDataRole.UserRole, source_id)
-            
             # Use icons instead of background colors for better readability
             if stat.total_entities > 0:
-                item.setText(0, f"✅ {source_id} ({stat.total_entities:,} entities)")
+                label = f"✅ {source_id} ({stat.total_entities:,} entities)"
             else:
-                item.setText(0, f"❌ {source_id} (0 entities)")
+                label = f"❌ {source_id} (0 entities)"
             
-            self.source_list.addTopLevelItem(item)
+            item = self._source_items.get(source_id)
+            if item is None:
+                item = QTreeWidgetItem([label])
+                item.setData(0, Qt.ItemDataRole.UserRole, source_id)
+                self.source_list.addTopLevelItem(item)
+                self._source_items[source_id] = item
+            elif item.text(0) != label:
+                item.setText(0, label)
         
         # Expand all items
         self.source_list.expandAll()
@@ -294,38 +412,30 @@ class StatisticsWidget(QWidget):
         if not self.statistics:
             return
         
-        # Combine all statistics
-        combined_countries = {}
-        combined_entity_types = {}
-        combined_date_ranges = {}
-        
-        for stat in self.statistics.values():
-            # Combine countries
-            for country, count in stat.countries.items():
-                combined_countries[country] = combined_countries.get(country, 0) + count
-            
-            # Combine entity types
-            for entity_type, count in stat.entity_types.items():
-                combined_entity_types[entity_type] = combined_entity_types.get(entity_type, 0) + count
-            
-            # Combine date ranges
-            for year, count in stat.date_ranges.items():
-                combined_date_ranges[year] = combined_date_ranges.get(year, 0) + count
+        entity_type_rows, country_rows, timeline_rows, raw_json = self._get_combined_details()
         
         # Update tables
-        self.populate_table(self.entity_types_table, combined_entity_types)
-        self.populate_table(self.countries_table, combined_countries)
-        self.populate_table(self.timeline_table, combined_date_ranges)
+        self.fill_table(self.entity_types_table, entity_type_rows)
+        self.fill_table(self.countries_table, country_rows)
+        self.fill_table(self.timeline_table, timeline_rows)
         
         # Update raw data
-        raw_data = {
-            "source": "All Sources Combined",
-            "entity_types": combined_entity_types,
-            "countries": combined_countries,
-            "timeline": combined_date_ranges,
-            "generated_at": datetime.now().isoformat()
-        }
-        self.raw_data_text.setPlainText(json.dumps(raw_data, indent=2))
+        self.raw_data_text.setPlainText(raw_json)
+    
+    def _get_combined_details(self):
+        """
+        Get the statistics of all sources combined, computed once per statistics refresh.
+        
+        Returns:
+            Tuple of entity type, country and timeline table rows, and the raw data JSON
+        """
+        cache = self._combined_cache
+        if cache is not None and cache[0] == self._stats_version:
+            return cache[1:]
+        
+        combined = _combine_statistics(self.statistics)
+        self._combined_cache = (self._stats_version,) + combined
+        return combined
     
     def update_source_details(self, source_id: str):
         """Update details for a specific source."""
@@ -355,35 +465,44 @@ class StatisticsWidget(QWidget):
     
     def populate_table(self, table: QTableWidget, data: Dict[str, int]):
         """Populate a table with data."""
-        if not data:
+        self.fill_table(table, _table_rows(data) if data else [])
+    
+    def fill_table(self, table: QTableWidget, rows: List[Tuple[str, int, float]]):
+        """Populate a table with precomputed (key, count, percentage) rows."""
+        if not rows:
             table.setRowCount(0)
             return
         
-        # Sort data by count (descending)
-        sorted_data = sorted(data.items(), key=lambda x: x[1], reverse=True)
-        total = sum(data.values())
-        
-        table.setRowCount(len(sorted_data))
-        
-        for row, (key, count) in enumerate(sorted_data):
-            # Key (country, entity type, year, etc.)
-            table.setItem(row, 0, QTableWidgetItem(str(key)))
-            
-            # Count
-            count_item = QTableWidgetItem(f"{count:,}")
-            count_item.setData(Qt.ItemDataRole.UserRole, count)  # For sorting
-            table.setItem(row, 1, count_item)
-            
-            # Percentage
-            percentage = (count / total * 100) if total > 0 else 0
-            percentage_item = QTableWidgetItem(f"{percentage:.1f}%")
-            percentage_item.setData(Qt.ItemDataRole.UserRole, percentage)  # For sorting
-            table.setItem(row, 2, percentage_item)
+        # With sorting on, every setItem re-sorts the table and schedules a repaint;
+        # fill it as-is and sort once when sorting is re-enabled
+        header = table.horizontalHeader()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        header.setSortIndicatorShown(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(rows))
             
-            # Use text indicators instead of background colors for high percentages
-            if percentage > 10:
-                key_item = table.item(row, 0)
-                key_item.setText(f"⭐ {key}")  # Add star for high percentages
+            for row, (key, count, percentage) in enumerate(rows):
+                # Key (country, entity type, year, etc.); use text indicators instead of
+                # background colors for high percentages
+                key_text = f"⭐ {key}" if percentage > 10 else str(key)
+                table.setItem(row, 0, QTableWidgetItem(key_text))
+                
+                # Count
+                count_item = QTableWidgetItem(f"{count:,}")
+                count_item.setData(Qt.ItemDataRole.UserRole, count)  # For sorting
+                table.setItem(row, 1, count_item)
+                
+                # Percentage
+                percentage_item = QTableWidgetItem(f"{percentage:.1f}%")
+                percentage_item.setData(Qt.ItemDataRole.UserRole, percentage)  # For sorting
+                table.setItem(row, 2, percentage_item)
+        finally:
+            table.blockSignals(False)
+            header.setSortIndicatorShown(True)
+            table.setSortingEnabled(True)
+            table.setUpdatesEnabled(True)
     
     def export_statistics(self):
         """Export statistics to a file."""
@@ -425,23 +544,54 @@ class StatisticsWidget(QWidget):
                         "last_updated": stat.last_updated.isoformat() if stat.last_updated else None
                     }
                 
-                # Write to file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                
-                self.status_label.setText(f"Statistics exported to {filename}")
+                # Write to file in the background
+                self.export_btn.setEnabled(False)
+                self.status_label.setText(f"Exporting statistics to {filename}...")
+                self._export_task = StatisticsExportTask(export_data, filename)
+                self._export_task.signals.finished.connect(self.on_export_finished)
+                self._export_task.signals.failed.connect(self.on_export_failed)
+                QThreadPool.globalInstance().start(self._export_task)
                 
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Export Error", f"Failed to export statistics: {str(e)}")
+            self.on_export_failed(str(e))
+    
+    def on_export_finished(self, filename: str):
+        """Handle a completed statistics export."""
+        self._export_task = None
+        self.export_btn.setEnabled(True)
+        self.status_label.setText(f"Statistics exported to {filename}")
+    
+    def on_export_failed(self, error: str):
+        """Handle a failed statistics export."""
+        from PyQt6.QtWidgets import QMessageBox
+        self._export_task = None
+        self.export_btn.setEnabled(True)
+        QMessageBox.warning(self, "Export Error", f"Failed to export statistics: {error}")
+    
+    def showEvent(self, event):
+        """Resume automatic refresh and catch up on refreshes missed while hidden."""
+        super().showEvent(event)
+        self.timer.start()
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._do_refresh()
+    
+    def hideEvent(self, event):
+        """Pause automatic refresh while nobody can see the statistics."""
+        self.timer.stop()
+        if self._refresh_debounce.isActive():
+            self._refresh_debounce.stop()
+            self._refresh_pending = True
+        super().hideEvent(event)
     
     def closeEvent(self, event):
         """Handle widget close event."""
-        if self.calculation_worker and self.calculation_worker.isRunning():
-            self.calculation_worker.terminate()
-            self.calculation_worker.wait()
+        # A running query cannot be interrupted safely; just drop its result
+        if self.calculation_worker is not None:
+            self.calculation_worker.cancel()
         
         if hasattr(self, 'timer'):
             self.timer.stop()
+            self._refresh_debounce.stop()
         
         event.accept()
\ No newline at end of file
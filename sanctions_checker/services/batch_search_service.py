@@ -39,56 +39,51 @@ class BatchSearchWorker(QThread):
             
             all_results = []
             
-            for i, query_data in enumerate(self.search_queries):
-                if self._is_cancelled:
-                    break
-                
-                query = query_data.get('query', '')
-                entity_type = query_data.get('entity_type')
-                tags = query_data.get('tags', [])
-                user_id = query_data.get('user_id', 'batch_user')
-                
-                self.search_progress.emit(i, query, 'searching')
+            # Run every query on one session, reusing the loaded candidate entities
+            jobs = [
+                {
+                    'query': query_data.get('query', ''),
+                    'entity_type': query_data.get('entity_type'),
+                    'tags': query_data.get('tags', []),
+                    'user_id': query_data.get('user_id', 'batch_user')
+                }
+                for query_data in self.search_queries
+            ]
+            results = self.search_service.search_entities_batch(jobs)
+            
+            try:
+                if jobs and not self._is_cancelled:
+                    self.search_progress.emit(0, jobs[0]['query'], 'searching')
                 
-                try:
-                    # Perform the search
-                    matches, search_record_id = self.search_service.search_entities(
-                        query=query,
-                        entity_type=entity_type,
-                        user_id=user_id,
-                        tags=tags
-                    )
+                for i, job, matches, search_record_id, error_msg in results:
+                    query = job['query']
                     
                     result_data = {
                         'index': i,
                         'query': query,
                         'matches': matches,
                         'record_id': search_record_id,
-                        'entity_type': entity_type,
-                        'tags': tags,
-                        'status': 'completed'
+                        'entity_type': job['entity_type'],
+                        'tags': job['tags'],
+                        'status': 'completed' if error_msg is None else 'error'
                     }
                     
-                    all_results.append(result_data)
-                    self.search_completed.emit(i, query, matches, search_record_id)
+                    if error_msg is None:
+                        self.search_completed.emit(i, query, matches, search_record_id)
+                    else:
+                        logger.error(f"Batch search error for '{query}': {error_msg}")
+                        result_data['error'] = error_msg
+                        self.search_error.emit(i, query, error_msg)
                     
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Batch search error for '{query}': {error_msg}")
+                    all_results.append(result_data)
                     
-                    result_data = {
-                        'index': i,
-                        'query': query,
-                        'matches': [],
-                        'record_id': None,
-                        'entity_type': entity_type,
-                        'tags': tags,
-                        'status': 'error',
-                        'error': error_msg
-                    }
+                    if self._is_cancelled:
+                        break
                     
-                    all_results.append(result_data)
-                    self.search_error.emit(i, query, error_msg)
+                    if i + 1 < len(jobs):
+                        self.search_progress.emit(i + 1, jobs[i + 1]['query'], 'searching')
+            finally:
+                results.close()
             
             if not self._is_cancelled:
                 self.batch_completed.emit(all_results)
@@ -232,3 +227,7 @@ class BatchSearchService(QObject):
         """Cancel the current batch search operation."""
         if self.current_worker and self.current_worker.isRunning():
             self.current_worker.cancel()
+    
+    def is_batch_running(self) -> bool:
+        """Check whether a batch search is still running."""
+        return bool(self.current_worker and self.current_worker.isRunning())
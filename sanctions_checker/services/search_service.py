@@ -10,7 +10,7 @@ This module provides the main search functionality that:
 
 import hashlib
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterator
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
@@ -170,69 +170,8 @@ class SearchService:
         
         session = self.db_manager.get_session()
         try:
-            all_matches = []
-            
-            # Search official sanctions entities
-            entities_query = session.query(SanctionedEntity)
-            if entity_type:
-                entities_query = entities_query.filter(SanctionedEntity.entity_type == entity_type.upper())
-            
-            official_entities = entities_query.all()
-            logger.info(f"Found {len(official_entities)} official entities to search against")
-            
-            # Perform matching against official entities
-            official_matches = self._match_against_entities(query, official_entities)
-            all_matches.extend(official_matches)
-            
-            # Search custom sanctions entities if enabled
-            if self.config.enable_custom_sanctions:
-                logger.debug("Searching custom sanctions entities...")
-                from sqlalchemy.orm import joinedload
-                custom_entities_query = session.query(CustomSanctionEntity).options(
-                    joinedload(CustomSanctionEntity.names),
-                    joinedload(CustomSanctionEntity.individual_details),
-                    joinedload(CustomSanctionEntity.entity_details)
-                )
-                
-                # Filter by entity type if specified
-                if entity_type:
-                    # Map entity types to subject types
-                    subject_type_mapping = {
-                        'INDIVIDUAL': 'Individual',
-                        'COMPANY': 'Entity',
-                        'ENTITY': 'Entity'
-                    }
-                    subject_type = subject_type_mapping.get(entity_type.upper())
-                    if subject_type:
-                        from ..models.base import SubjectType
-                        custom_entities_query = custom_entities_query.filter(
-                            CustomSanctionEntity.subject_type == SubjectType(subject_type)
-                        )
-                
-                # Only search active custom sanctions
-                from ..models.base import RecordStatus
-                custom_entities_query = custom_entities_query.filter(
-                    CustomSanctionEntity.record_status == RecordStatus.ACTIVE
-                )
-                
-                custom_entities = custom_entities_query.all()
-                logger.info(f"Found {len(custom_entities)} custom entities to search against")
-                
-                # Perform matching against custom entities
-                logger.debug("Starting custom entity matching...")
-                custom_matches = self._match_against_custom_entities(query, custom_entities)
-                logger.debug(f"Custom entity matching completed with {len(custom_matches)} matches")
-                all_matches.extend(custom_matches)
-            
-            # Filter by minimum confidence and limit results
-            filtered_matches = [
-                match for match in all_matches 
-                if match.overall_confidence >= self.config.minimum_overall_confidence
-            ]
-            
-            # Sort by confidence (highest first) and limit results
-            filtered_matches.sort(key=lambda x: x.overall_confidence, reverse=True)
-            filtered_matches = filtered_matches[:self.config.max_results]
+            official_entities, custom_entities = self._load_search_candidates(session, entity_type)
+            filtered_matches = self._rank_matches(query, official_entities, custom_entities)
             
             # Create search record for audit trail
             search_record_id = self._create_search_record(
@@ -257,6 +196,150 @@ class SearchService:
         finally:
             self.db_manager.close_session(session)
     
+    def search_entities_batch(self,
+                              jobs: List[Dict[str, Any]]
+                              ) -> Iterator[Tuple[int, Dict[str, Any], List[EntityMatch], Optional[str], Optional[str]]]:
+        """
+        Run several searches on a single database session.
+        
+        Candidate entities are loaded once per entity type and reused for
+        every query in the batch, instead of being re-queried per search.
+        
+        Args:
+            jobs: List of dicts with 'query' and optional 'entity_type',
+                  'user_id' and 'tags' keys
+            
+        Yields:
+            Tuple of (index, job, matches, search_record_id, error_message);
+            on failure matches is empty, search_record_id is None and
+            error_message is set
+        """
+        session = self.db_manager.get_session()
+        candidates: Dict[Optional[str], Tuple[List[SanctionedEntity], List[CustomSanctionEntity]]] = {}
+        try:
+            for index, job in enumerate(jobs):
+                query = (job.get('query') or '').strip()
+                entity_type = job.get('entity_type')
+                try:
+                    if not query:
+                        raise ValueError("Search query cannot be empty")
+                    
+                    if entity_type not in candidates:
+                        candidates[entity_type] = self._load_search_candidates(session, entity_type)
+                        # Detach the loaded candidates so per-search commits don't expire them
+                        session.expunge_all()
+                    
+                    matches = self._rank_matches(query, *candidates[entity_type])
+                    search_record_id = self._create_search_record(
+                        session, query, matches, job.get('user_id'), job.get('tags')
+                    )
+                    session.commit()
+                    
+                except Exception as e:
+                    session.rollback()
+                    logger.error(f"Batch search failed for '{query}': {e}")
+                    yield index, job, [], None, str(e)
+                    continue
+                
+                yield index, job, matches, search_record_id, None
+        finally:
+            self.db_manager.close_session(session)
+    
+    def _load_search_candidates(self,
+                                session: Session,
+                                entity_type: Optional[str]
+                                ) -> Tuple[List[SanctionedEntity], List[CustomSanctionEntity]]:
+        """
+        Load the official and custom entities a query should be matched against.
+        
+        Args:
+            session: Database session
+            entity_type: Optional filter by entity type (INDIVIDUAL, COMPANY)
+            
+        Returns:
+            Tuple of (official entities, custom entities)
+        """
+        # Search official sanctions entities
+        entities_query = session.query(SanctionedEntity)
+        if entity_type:
+            entities_query = entities_query.filter(SanctionedEntity.entity_type == entity_type.upper())
+        
+        official_entities = entities_query.all()
+        logger.info(f"Found {len(official_entities)} official entities to search against")
+        
+        custom_entities = []
+        
+        # Search custom sanctions entities if enabled
+        if self.config.enable_custom_sanctions:
+            logger.debug("Searching custom sanctions entities...")
+            from sqlalchemy.orm import joinedload
+            custom_entities_query = session.query(CustomSanctionEntity).options(
+                joinedload(CustomSanctionEntity.names),
+                joinedload(CustomSanctionEntity.individual_details),
+                joinedload(CustomSanctionEntity.entity_details)
+            )
+            
+            # Filter by entity type if specified
+            if entity_type:
+                # Map entity types to subject types
+                subject_type_mapping = {
+                    'INDIVIDUAL': 'Individual',
+                    'COMPANY': 'Entity',
+                    'ENTITY': 'Entity'
+                }
+                subject_type = subject_type_mapping.get(entity_type.upper())
+                if subject_type:
+                    from ..models.base import SubjectType
+                    custom_entities_query = custom_entities_query.filter(
+                        CustomSanctionEntity.subject_type == SubjectType(subject_type)
+                    )
+            
+            # Only search active custom sanctions
+            from ..models.base import RecordStatus
+            custom_entities_query = custom_entities_query.filter(
+                CustomSanctionEntity.record_status == RecordStatus.ACTIVE
+            )
+            
+            custom_entities = custom_entities_query.all()
+            logger.info(f"Found {len(custom_entities)} custom entities to search against")
+        
+        return official_entities, custom_entities
+    
+    def _rank_matches(self,
+                      query: str,
+                      official_entities: List[SanctionedEntity],
+                      custom_entities: List[CustomSanctionEntity]) -> List[EntityMatch]:
+        """
+        Match a query against candidate entities and rank the results.
+        
+        Args:
+            query: Search query string
+            official_entities: Official sanctioned entities to match against
+            custom_entities: Custom sanctioned entities to match against
+            
+        Returns:
+            Matches above the confidence threshold, highest first, limited to max_results
+        """
+        # Perform matching against official entities
+        all_matches = self._match_against_entities(query, official_entities)
+        
+        # Perform matching against custom entities
+        if custom_entities:
+            logger.debug("Starting custom entity matching...")
+            custom_matches = self._match_against_custom_entities(query, custom_entities)
+            logger.debug(f"Custom entity matching completed with {len(custom_matches)} matches")
+            all_matches.extend(custom_matches)
+        
+        # Filter by minimum confidence and limit results
+        filtered_matches = [
+            match for match in all_matches 
+            if match.overall_confidence >= self.config.minimum_overall_confidence
+        ]
+        
+        # Sort by confidence (highest first) and limit results
+        filtered_matches.sort(key=lambda x: x.overall_confidence, reverse=True)
+        return filtered_matches[:self.config.max_results]
+    
     def _match_against_entities(self, query: str, entities: List[SanctionedEntity]) -> List[EntityMatch]:
         """
         Match query against a list of sanctioned entities.
@@ -6,7 +6,8 @@ Resource manager for handling application assets like logos, icons, etc.
 import os
 import sys
 from pathlib import Path
-from PyQt6.QtGui import QPixmap, QIcon
+from typing import Optional, Tuple
+from PyQt6.QtGui import QPixmap, QPixmapCache, QIcon, QImage, QGuiApplication
 from PyQt6.QtCore import Qt
 
 
@@ -42,37 +43,126 @@ class ResourceManager:
         self.logo_path = self.assets_dir / "logo.png"
         self.icon_path = self.assets_dir / "icon.ico"
         self.logo_small_path = self.assets_dir / "logo_small.png"
+        
+        # Scaled logos live in QPixmapCache (size-bounded by Qt); remember our keys
+        # so they can be dropped without flushing pixmaps cached by Qt itself
+        self._pixmap_keys = set()
+        self._icon_cache = {}
+    
+    def clear_cache(self):
+        """Drop all cached pixmaps and icons so the next request reloads from disk."""
+        for key in self._pixmap_keys:
+            QPixmapCache.remove(key)
+        self._pixmap_keys.clear()
+        self._icon_cache.clear()
+    
+    def _file_stamp(self, path: Path):
+        """Return the modification time of a resource file, or None if it does not exist."""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def device_pixel_ratio(self) -> float:
+        """Get the device pixel ratio of the primary screen."""
+        app = QGuiApplication.instance()
+        screen = app.primaryScreen() if app else None
+        return screen.devicePixelRatio() if screen else 1.0
+    
+    def _logo_cache_key(self, stamp, width, height, dpr) -> str:
+        """Build the QPixmapCache key for a logo file state and size."""
+        return f"sanctions_checker:logo:{stamp}:{width}x{height}@{dpr}"
     
     def get_logo_pixmap(self, width: int = None, height: int = None) -> QPixmap:
         """Get the main logo as a QPixmap, optionally scaled."""
-        if self.logo_path.exists():
-            pixmap = QPixmap(str(self.logo_path))
-            
-            if width or height:
-                # Scale the pixmap while maintaining aspect ratio
-                if width and height:
-                    pixmap = pixmap.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, 
-                                         Qt.TransformationMode.SmoothTransformation)
-                elif width:
-                    pixmap = pixmap.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
-                elif height:
-                    pixmap = pixmap.scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)
-            
+        logo_stamp = self._file_stamp(self.logo_path)
+        dpr = self.device_pixel_ratio()
+        key = self._logo_cache_key(logo_stamp, width, height, dpr)
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
             return pixmap
+        
+        if logo_stamp is not None:
+            pixmap = QPixmap.fromImage(self._read_logo_image(width, height, dpr))
         else:
             # Return a placeholder pixmap if logo doesn't exist
-            return self._create_placeholder_logo(width or 200, height or 100)
+            pixmap = self._create_placeholder_logo(width or 200, height or 100)
+        
+        QPixmapCache.insert(key, pixmap)
+        self._pixmap_keys.add(key)
+        return pixmap
+    
+    def find_cached_logo_pixmap(self, width: int = None, height: int = None) -> Optional[QPixmap]:
+        """Get the logo pixmap for the current logo file if it is already cached, else None."""
+        key = self._logo_cache_key(self._file_stamp(self.logo_path), width, height,
+                                   self.device_pixel_ratio())
+        return QPixmapCache.find(key)
+    
+    def load_logo_image(self, width: int = None, height: int = None,
+                        dpr: float = 1.0) -> Tuple[Optional[int], Optional[QImage]]:
+        """
+        Read and scale the logo file as a QImage.
+        
+        Unlike get_logo_pixmap this is safe to call from a worker thread; pass the
+        result to cache_logo_pixmap on the UI thread.
+        
+        Returns:
+            Tuple of the logo file stamp and image, or (None, None) if there is no logo.
+        """
+        logo_stamp = self._file_stamp(self.logo_path)
+        if logo_stamp is None:
+            return None, None
+        return logo_stamp, self._read_logo_image(width, height, dpr)
+    
+    def cache_logo_pixmap(self, stamp: int, image: QImage, width: int = None,
+                          height: int = None, dpr: float = 1.0) -> QPixmap:
+        """Convert a logo image from load_logo_image to a pixmap and cache it."""
+        pixmap = QPixmap.fromImage(image)
+        key = self._logo_cache_key(stamp, width, height, dpr)
+        QPixmapCache.insert(key, pixmap)
+        self._pixmap_keys.add(key)
+        return pixmap
+    
+    def _read_logo_image(self, width: int, height: int, dpr: float) -> QImage:
+        """Load the logo file, scaled while maintaining aspect ratio and rendered at device resolution."""
+        image = QImage(str(self.logo_path))
+        
+        if width or height:
+            scaled_width = round(width * dpr) if width else None
+            scaled_height = round(height * dpr) if height else None
+            if width and height:
+                image = image.scaled(scaled_width, scaled_height, Qt.AspectRatioMode.KeepAspectRatio, 
+                                     Qt.TransformationMode.SmoothTransformation)
+            elif width:
+                image = image.scaledToWidth(scaled_width, Qt.TransformationMode.SmoothTransformation)
+            elif height:
+                image = image.scaledToHeight(scaled_height, Qt.TransformationMode.SmoothTransformation)
+            image.setDevicePixelRatio(dpr)
+        return image
     
     def get_application_icon(self) -> QIcon:
         """Get the application icon."""
-        if self.icon_path.exists():
-            return QIcon(str(self.icon_path))
-        elif self.logo_path.exists():
+        icon_stamp = self._file_stamp(self.icon_path)
+        logo_stamp = self._file_stamp(self.logo_path)
+        key = ('icon', icon_stamp, logo_stamp)
+        
+        icon = self._icon_cache.get(key)
+        if icon is not None:
+            return icon
+        
+        if icon_stamp is not None:
+            icon = QIcon(str(self.icon_path))
+        elif logo_stamp is not None:
             # Use logo as icon if no dedicated icon exists
-            return QIcon(str(self.logo_path))
+            icon = QIcon(str(self.logo_path))
         else:
             # Return empty icon if no resources available
-            return QIcon()
+            icon = QIcon()
+        
+        # Only the icon for the current file state is ever requested again
+        self._icon_cache = {key: icon}
+        return icon
     
     def get_small_logo_pixmap(self, size: int = 32) -> QPixmap:
         """Get a small version of the logo for toolbars, etc."""
@@ -129,6 +219,7 @@ class ResourceManager:
             if source.exists():
                 import shutil
                 shutil.copy2(source, self.logo_path)
+                self.clear_cache()
                 return True
         except Exception as e:
             print(f"Error installing logo: {e}")
@@ -141,6 +232,7 @@ class ResourceManager:
                 self.logo_path.unlink()
             if self.logo_small_path.exists():
                 self.logo_small_path.unlink()
+            self.clear_cache()
             return True
         except Exception as e:
             print(f"Error resetting logo: {e}")